@@ -15,9 +15,12 @@ import pandas as pd
 import plotly.express as px
 import traceback
 from utils.resume_analyzer import ResumeAnalyzer
+from utils.analysis_cache import AnalysisCache
+from utils.document_ingestion import load_document
 from utils.resume_builder import ResumeBuilder
+from utils.streaming_export import RESUME_EXPORT_QUERY, export_excel
 from config.database import (
-    get_database_connection, save_resume_data, save_analysis_data, 
+    save_resume_data, save_analysis_data, 
     init_database, verify_admin, log_admin_action
 )
 from config.job_roles import JOB_ROLES
@@ -88,6 +91,7 @@ class ResumeApp:
         self.dashboard_manager = DashboardManager()
         
         self.analyzer = ResumeAnalyzer()
+        self.analysis_cache = AnalysisCache()
         self.builder = ResumeBuilder()
         self.job_roles = JOB_ROLES
         
@@ -452,37 +456,12 @@ class ResumeApp:
             return None
 
     def export_to_excel(self):
-        """Export resume data to Excel"""
-        conn = get_database_connection()
-        
-        # Get resume data with analysis
-        query = """
-            SELECT 
-                rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
-                rd.summary, rd.target_role, rd.target_category,
-                rd.education, rd.experience, rd.projects, rd.skills,
-                ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
-                ra.missing_skills, ra.recommendations,
-                rd.created_at
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-        """
-        
+        """Export resume data with analysis to Excel as a streamed file handle"""
         try:
-            # Read data into DataFrame
-            df = pd.read_sql_query(query, conn)
-            
-            # Create Excel writer object
-            output = io.BytesIO()
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='Resume Data')
-            
-            return output.getvalue()
+            return export_excel(RESUME_EXPORT_QUERY, sheet_name='Resume Data')
         except Exception as e:
             print(f"Error exporting to Excel: {str(e)}")
             return None
-        finally:
-            conn.close()
 
     def render_dashboard(self):
         """Render the dashboard page"""
@@ -510,10 +489,7 @@ class ResumeApp:
         if uploaded_file is not None:
             try:
                 # Extract text from resume
-                if uploaded_file.type == "application/pdf":
-                    resume_text = extract_text_from_pdf(uploaded_file)
-                else:
-                    resume_text = extract_text_from_docx(uploaded_file)
+                resume_text = load_document(uploaded_file).text
                 
                 # Store resume data
                 st.session_state.resume_data = {
@@ -1127,62 +1103,72 @@ class ResumeApp:
         )
         if uploaded_file:
             with st.spinner("Analyzing your document..."):
-                # Get file content
-                text = ""
-                try:
-                    if uploaded_file.type == "application/pdf":
-                        text = self.analyzer.extract_text_from_pdf(uploaded_file)
-                    elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                        text = self.analyzer.extract_text_from_docx(uploaded_file)
-                    else:
-                        text = uploaded_file.getvalue().decode()
-                except Exception as e:
-                    st.error(f"Error reading file: {str(e)}")
-                    return
-
-                
-                # Analyze the document
-                analysis = self.analyzer.analyze_resume({'raw_text': text}, role_info)
-                
-                # Save resume data to database
-                resume_data = {
-                    'personal_info': {
-                        'name': analysis.get('name', ''),
-                        'email': analysis.get('email', ''),
-                        'phone': analysis.get('phone', ''),
-                        'linkedin': analysis.get('linkedin', ''),
-                        'github': analysis.get('github', ''),
-                        'portfolio': analysis.get('portfolio', '')
-                    },
-                    'summary': analysis.get('summary', ''),
-                    'target_role': selected_role,
-                    'target_category': selected_category,
-                    'education': analysis.get('education', []),
-                    'experience': analysis.get('experience', []),
-                    'projects': analysis.get('projects', []),
-                    'skills': analysis.get('skills', []),
-                    'template': ''
-                }
+                # Reuse the previous analysis when the same file is analyzed for the same role
+                cache_key = self.analysis_cache.make_key(uploaded_file.getbuffer(), {
+                    'category': selected_category,
+                    'role': selected_role,
+                    'requirements': role_info
+                })
+                cached = self.analysis_cache.get(cache_key)
                 
-                # Save to database
-                try:
-                    resume_id = save_resume_data(resume_data)
+                if cached:
+                    analysis, resume_id = cached
+                else:
+                    # Get file content
+                    text = ""
+                    try:
+                        text = load_document(uploaded_file).text
+                    except Exception as e:
+                        st.error(f"Error reading file: {str(e)}")
+                        return
+
                     
-                    # Save analysis data
-                    analysis_data = {
-                        'resume_id': resume_id,
-                        'ats_score': analysis['ats_score'],
-                        'keyword_match_score': analysis['keyword_match']['score'],
-                        'format_score': analysis['format_score'],
-                        'section_score': analysis['section_score'],
-                        'missing_skills': ','.join(analysis['keyword_match']['missing_skills']),
-                        'recommendations': ','.join(analysis['suggestions'])
+                    # Analyze the document
+                    analysis = self.analyzer.analyze_resume({'raw_text': text}, role_info)
+                    
+                    # Save resume data to database
+                    resume_data = {
+                        'personal_info': {
+                            'name': analysis.get('name', ''),
+                            'email': analysis.get('email', ''),
+                            'phone': analysis.get('phone', ''),
+                            'linkedin': analysis.get('linkedin', ''),
+                            'github': analysis.get('github', ''),
+                            'portfolio': analysis.get('portfolio', '')
+                        },
+                        'summary': analysis.get('summary', ''),
+                        'target_role': selected_role,
+                        'target_category': selected_category,
+                        'education': analysis.get('education', []),
+                        'experience': analysis.get('experience', []),
+                        'projects': analysis.get('projects', []),
+                        'skills': analysis.get('skills', []),
+                        'template': ''
                     }
-                    save_analysis_data(resume_id, analysis_data)
-                    st.success("Resume data saved successfully!")
-                except Exception as e:
-                    st.error(f"Error saving to database: {str(e)}")
-                    print(f"Database error: {e}")
+                    
+                    # Save to database
+                    resume_id = None
+                    try:
+                        resume_id = save_resume_data(resume_data)
+                        
+                        # Save analysis data
+                        analysis_data = {
+                            'resume_id': resume_id,
+                            'ats_score': analysis['ats_score'],
+                            'keyword_match_score': analysis['keyword_match']['score'],
+                            'format_score': analysis['format_score'],
+                            'section_score': analysis['section_score'],
+                            'missing_skills': ','.join(analysis['keyword_match']['missing_skills']),
+                            'recommendations': ','.join(analysis['suggestions'])
+                        }
+                        save_analysis_data(resume_id, analysis_data)
+                        st.success("Resume data saved successfully!")
+                    except Exception as e:
+                        st.error(f"Error saving to database: {str(e)}")
+                        print(f"Database error: {e}")
+                    
+                    if resume_id is not None:
+                        self.analysis_cache.put(cache_key, analysis, resume_id)
                 
                 # Show results based on document type
                 if analysis.get('document_type') != 'resume':
@@ -1513,6 +1499,7 @@ class ResumeApp:
             # Admin Login/Logout section at bottom
             if st.session_state.get('is_admin', False):
                 st.success(f"Logged in as: {st.session_state.get('current_admin_email')}")
+                self.dashboard_manager.render_query_cache_stats()
                 if st.button("Logout", key="logout_button"):
                     try:
                         log_admin_action(st.session_state.get('current_admin_email'), "logout")
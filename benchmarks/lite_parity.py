@@ -0,0 +1,113 @@
+"""
+Report how far resume_analytics' lite pipeline diverges from the full spaCy model
+
+Both pipelines analyze the same synthetic corpus (every size and template,
+several seeds). For each metric the report gives the share of resumes with
+identical values and the mean/max absolute difference; skills are compared
+by Jaccard similarity. Needs the full model installed
+(python -m spacy download en_core_web_sm); without it only the lite timing
+is reported and the report's "skipped" field says why, so a missing model
+is never mistaken for parity.
+
+Usage:
+    python -m benchmarks.lite_parity [--seeds 5] [--model en_core_web_sm] [--output parity.json]
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+
+from benchmarks.synthetic import SIZES, TEMPLATES, generate_resume_files
+from resume_analytics.analyzer import ResumeAnalyzer
+from resume_analytics.nlp_models import FULL_MODEL, LITE_MODEL, get_nlp
+
+METRICS = ('word_count', 'sentence_count', 'skills_count', 'experience_years', 'profile_score')
+
+
+def build_corpus(seeds=5):
+    """Plain-text synthetic resumes for every size, template and seed"""
+    return [
+        generate_resume_files(size, seed, template)['txt'].decode('utf-8')
+        for size in SIZES
+        for template in TEMPLATES
+        for seed in range(seeds)
+    ]
+
+
+def _jaccard(left, right):
+    if not left and not right:
+        return 1.0
+    return len(left & right) / len(left | right)
+
+
+def compare(lite_results, full_results):
+    """Per-metric agreement between two analyze_many result lists"""
+    report = {}
+    for metric in METRICS:
+        diffs = [abs(lite['metrics'][metric] - full['metrics'][metric])
+                 for lite, full in zip(lite_results, full_results)]
+        report[metric] = {
+            'identical': round(sum(diff == 0 for diff in diffs) / len(diffs), 4),
+            'mean_abs_diff': round(statistics.fmean(diffs), 4),
+            'max_abs_diff': max(diffs)
+        }
+    similarities = [_jaccard(set(lite['skills']), set(full['skills']))
+                    for lite, full in zip(lite_results, full_results)]
+    report['skills'] = {
+        'identical': round(sum(similarity == 1.0 for similarity in similarities) / len(similarities), 4),
+        'mean_jaccard': round(statistics.fmean(similarities), 4),
+        'min_jaccard': round(min(similarities), 4)
+    }
+    return report
+
+
+def _timed_analysis(model, corpus):
+    analyzer = ResumeAnalyzer(model)
+    analyzer.analyze_resume('warm up')  # load the pipeline and skill matcher outside the timed section
+    started = time.perf_counter()
+    results = analyzer.analyze_many(corpus)
+    return results, time.perf_counter() - started
+
+
+def run(seeds=5, full_model=FULL_MODEL):
+    corpus = build_corpus(seeds)
+    lite_results, lite_seconds = _timed_analysis(LITE_MODEL, corpus)
+    try:
+        get_nlp(full_model)
+    except OSError as e:
+        return {
+            'corpus_size': len(corpus),
+            'full_model': full_model,
+            'seconds': {'lite': round(lite_seconds, 4)},
+            'skipped': f"Full model {full_model} could not be loaded, lite/full comparison not run: {str(e)}"
+        }
+    full_results, full_seconds = _timed_analysis(full_model, corpus)
+    return {
+        'corpus_size': len(corpus),
+        'full_model': full_model,
+        'seconds': {'lite': round(lite_seconds, 4), 'full': round(full_seconds, 4)},
+        'metrics': compare(lite_results, full_results)
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare lite and full-model resume analytics on a synthetic corpus")
+    parser.add_argument('--seeds', type=int, default=5, help="Resumes generated per size and template")
+    parser.add_argument('--model', default=FULL_MODEL, help="Full spaCy model name or path")
+    parser.add_argument('--output', help="Write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run(args.seeds, args.model)
+    if 'skipped' in report:
+        print(f"Skipped: {report['skipped']}", file=sys.stderr)
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(payload + '\n')
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Check that the dashboard's hot queries use the indexes added by the schema migrations
+
+Runs EXPLAIN QUERY PLAN against a freshly migrated database in a temporary
+directory and exits non-zero if any query falls back to a full scan.
+
+Usage:
+    python -m benchmarks.query_plans
+"""
+import os
+import sys
+import tempfile
+
+import config.database as database
+
+# (description, query, params, index expected in the plan)
+HOT_QUERIES = [
+    ('metrics join + created_at range', '''
+        SELECT COUNT(DISTINCT rd.id), AVG(ra.ats_score)
+        FROM resume_data rd
+        LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
+        WHERE rd.created_at >= ?
+    ''', ('2024-01-01 00:00:00',), 'idx_resume_data_created_at'),
+    ('all resume data join', '''
+        SELECT r.id, r.name, a.ats_score
+        FROM resume_data r
+        LEFT JOIN resume_analysis a ON r.id = a.resume_id
+        ORDER BY r.created_at DESC
+    ''', (), 'idx_resume_analysis_resume_id'),
+    ('analysis created_at range', '''
+        SELECT AVG(ats_score) FROM resume_analysis
+        WHERE created_at >= date('now', '-7 days')
+    ''', (), 'idx_resume_analysis_created_at'),
+    ('category filter', '''
+        SELECT COUNT(*) FROM resume_data WHERE target_category = ?
+    ''', ('Data Science and Analytics',), 'idx_resume_data_target_category'),
+    ('skill counts', '''
+        SELECT s.display_name, COUNT(DISTINCT rs.resume_id)
+        FROM resume_skills rs
+        JOIN skills s ON s.id = rs.skill_id
+        GROUP BY rs.skill_id
+    ''', (), 'idx_resume_skills_skill_id'),
+    ('top skills', '''
+        SELECT s.display_name, sc.resume_count
+        FROM skill_counts sc
+        JOIN skills s ON s.id = sc.skill_id
+        ORDER BY sc.resume_count DESC
+        LIMIT 3
+    ''', (), 'idx_skill_counts_resume_count'),
+    ('excel log by user', '''
+        SELECT user_id, job_role, content FROM excel_resume_log WHERE user_id = ? ORDER BY id
+    ''', ('user-1',), 'idx_excel_resume_log_user_id'),
+]
+
+
+def check_query_plans():
+    """Return (description, plan, used_index) for every hot query"""
+    results = []
+    for description, query, params, index_name in HOT_QUERIES:
+        plan = database.explain_query_plan(query, params)
+        results.append((description, plan, any(index_name in step for step in plan)))
+    return results
+
+
+def main():
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        database.close_database_connections()
+        os.chdir(workdir)
+        try:
+            database.init_database()
+            print(f"schema version {database.get_schema_version()}")
+            results = check_query_plans()
+        finally:
+            database.close_database_connections()
+            os.chdir(cwd)
+
+    for description, plan, used_index in results:
+        print(f"[{'ok' if used_index else 'SCAN'}] {description}")
+        for step in plan:
+            print(f"      {step}")
+    if not all(used_index for _, _, used_index in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Micro-benchmark: per-resume regex time with inline pattern strings vs the compiled pattern bank
+
+Usage:
+    python -m benchmarks.regex_benchmark [--repeat 2000]
+"""
+import argparse
+import re
+import timeit
+
+from utils.resume_analyzer import (
+    CONTACT_PATTERN, EDUCATION_FEATURES_PATTERN, EMAIL_PATTERN, EXPERIENCE_FEATURES_PATTERN,
+    GITHUB_PATTERN, LINKEDIN_PATTERN, PHONE_PATTERN, ResumeAnalyzer, _scan_features
+)
+
+SAMPLE_RESUME = """Jane Roe
+jane.roe@example.com | +1 555-123-4567 | linkedin.com/in/janeroe | github.com/janeroe
+
+PROFESSIONAL SUMMARY
+Backend engineer with six years of experience building data platforms and APIs.
+
+WORK EXPERIENCE
+Senior Software Engineer, Acme Corp (2019 - 2024)
+• Developed a streaming ingestion service in Python handling 2M events per day
+• Led a team of four engineers and improved deployment frequency
+Software Engineer, Globex (2016 - 2019)
+- Implemented REST APIs with Django and PostgreSQL
+- Designed the reporting pipeline used by finance
+
+EDUCATION
+Master of Science in Computer Science, State University (2016)
+GPA 3.8
+Bachelor of Engineering, City College (2014)
+
+SKILLS
+Python, Django, SQL, Docker, Kubernetes, AWS
+"""
+
+
+def legacy_regex_pass(text, experience, education):
+    """The regex work of one analyze_resume call before the pattern bank"""
+    contact_patterns = [
+        r'\b[\w\.-]+@[\w\.-]+\.\w+\b',
+        r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
+        r'linkedin\.com/\w+',
+    ]
+    any(re.search(pattern, text) for pattern in contact_patterns)
+    re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
+    re.search(r'(\+\d{1,3}[-.]?)?\s*\(?\d{3}\)?[-.]?\s*\d{3}[-.]?\s*\d{4}', text)
+    re.search(r'linkedin\.com/in/[\w-]+', text)
+    re.search(r'github\.com/[\w-]+', text)
+    any(re.search(r'\b(19|20)\d{2}\b', exp) for exp in experience)
+    any(re.search(r'[•\-\*]', exp) for exp in experience)
+    any(re.search(r'\b(developed|managed|created|implemented|designed|led|improved)\b',
+                  exp.lower()) for exp in experience)
+    any(re.search(r'\b(19|20)\d{2}\b', edu) for edu in education)
+    any(re.search(r'\b(bachelor|master|phd|b\.|m\.|diploma)\b', edu.lower()) for edu in education)
+    any(re.search(r'\b(gpa|cgpa|grade|percentage)\b', edu.lower()) for edu in education)
+
+
+def compiled_regex_pass(text, experience, education):
+    """The same checks through the compiled pattern bank"""
+    CONTACT_PATTERN.search(text)
+    EMAIL_PATTERN.search(text)
+    PHONE_PATTERN.search(text)
+    LINKEDIN_PATTERN.search(text)
+    GITHUB_PATTERN.search(text)
+    _scan_features(EXPERIENCE_FEATURES_PATTERN, experience)
+    _scan_features(EDUCATION_FEATURES_PATTERN, education)
+
+
+def run(text, repeat):
+    analyzer = ResumeAnalyzer()
+    experience = analyzer.extract_experience(text)
+    education = analyzer.extract_education(text)
+
+    results = {}
+    for label, func in (('inline patterns', legacy_regex_pass), ('compiled bank', compiled_regex_pass)):
+        timings = timeit.repeat(lambda: func(text, experience, education), number=repeat, repeat=5)
+        results[label] = min(timings) / repeat * 1e6
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare per-resume regex time before and after the pattern bank")
+    parser.add_argument('--repeat', type=int, default=2000, help="Resumes timed per round")
+    parser.add_argument('--file', help="Plain-text resume to use instead of the built-in sample")
+    args = parser.parse_args(argv)
+
+    text = SAMPLE_RESUME
+    if args.file:
+        with open(args.file, encoding='utf-8') as f:
+            text = f.read()
+
+    results = run(text, args.repeat)
+    before, after = results['inline patterns'], results['compiled bank']
+    for label, micros in results.items():
+        print(f"{label:>16}: {micros:8.2f} µs/resume")
+    print(f"{'speedup':>16}: {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Stage-by-stage benchmark of the resume analysis pipeline on synthetic resumes
+
+Every size (small, typical, huge) is generated from each ResumeBuilder
+template and timed as PDF, DOCX and plain text. Each stage runs on a cold
+analyzer cache so it is measured on its own. Results are written as JSON.
+
+Usage:
+    python -m benchmarks.run [--iterations 20] [--output results.json]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+from benchmarks.synthetic import SIZES, TEMPLATES, generate_resume_files
+from config.job_roles import JOB_ROLES
+from utils.batch_analyzer import build_resume_record
+from utils.document_ingestion import load_document
+from utils.resume_analyzer import ResumeAnalyzer
+
+DEFAULT_CATEGORY = 'Software Development and Engineering'
+DEFAULT_ROLE = 'Backend Developer'
+FORMATS = ('pdf', 'docx', 'txt')
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(samples, pct):
+    """Linear-interpolated percentile of a non-empty list"""
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(samples):
+    """Timing summary in milliseconds"""
+    millis = [sample * 1000 for sample in samples]
+    summary = {
+        'n': len(millis),
+        'mean_ms': round(statistics.fmean(millis), 4),
+        'min_ms': round(min(millis), 4),
+        'max_ms': round(max(millis), 4)
+    }
+    for pct in PERCENTILES:
+        summary[f"p{pct}_ms"] = round(percentile(millis, pct), 4)
+    return summary
+
+
+def _reset(analyzer):
+    # Drop the per-text segment/keyword memo so every stage starts cold
+    analyzer._segment_cache = None
+    analyzer._hits_cache = None
+
+
+def _timed(timings, stage, func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    timings.setdefault(stage, []).append(time.perf_counter() - started)
+    return result
+
+
+def time_resume(analyzer, file_bytes, extension, job_requirements, timings, persist):
+    """Time every pipeline stage once for one resume file"""
+    import config.database as database
+
+    text = _timed(timings, 'extraction', lambda: load_document(file_bytes, name=f"resume.{extension}").text)
+
+    stages = (
+        ('detect_document_type', analyzer.detect_document_type),
+        ('extract_personal_info', analyzer.extract_personal_info),
+        ('extract_education', analyzer.extract_education),
+        ('extract_experience', analyzer.extract_experience),
+        ('extract_projects', analyzer.extract_projects),
+        ('extract_skills', analyzer.extract_skills),
+        ('extract_summary', analyzer.extract_summary)
+    )
+    for stage, func in stages:
+        _reset(analyzer)
+        _timed(timings, stage, func, text)
+
+    _reset(analyzer)
+    keyword_match = _timed(timings, 'calculate_keyword_match', analyzer.calculate_keyword_match,
+                           text, job_requirements.get('required_skills', []))
+
+    _reset(analyzer)
+    document = analyzer._analyze_document(text)
+    _timed(timings, 'scoring', analyzer._score_document, document, keyword_match, job_requirements)
+
+    _reset(analyzer)
+    analysis = _timed(timings, 'analyze_resume', analyzer.analyze_resume, {'raw_text': text}, job_requirements)
+
+    if persist:
+        resume_data, analysis_data = build_resume_record(analysis, DEFAULT_ROLE, DEFAULT_CATEGORY)
+
+        def save():
+            resume_id = database.save_resume_data(resume_data)
+            database.save_analysis_data(resume_id, analysis_data)
+        _timed(timings, 'db_persistence', save)
+
+
+def run(iterations=20, seed=0, sizes=None, formats=FORMATS, persist=True):
+    """Benchmark the pipeline and return the JSON-ready report"""
+    import config.database as database
+
+    sizes = sizes or list(SIZES)
+    job_requirements = JOB_ROLES[DEFAULT_CATEGORY][DEFAULT_ROLE]
+    analyzer = ResumeAnalyzer()
+
+    corpus = {
+        size: [generate_resume_files(size, seed, template) for template in TEMPLATES]
+        for size in sizes
+    }
+
+    results = {}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        if persist:
+            # The database lives in the working directory, so keep benchmark rows out of the real one
+            database.close_database_connections()
+            os.chdir(workdir)
+            database.init_database()
+        try:
+            for size, files in corpus.items():
+                for extension in formats:
+                    timings = {}
+                    for _ in range(iterations):
+                        for resume_files in files:
+                            time_resume(analyzer, resume_files[extension], extension,
+                                        job_requirements, timings, persist)
+                    results[f"{size}/{extension}"] = {
+                        'bytes': round(statistics.fmean(len(f[extension]) for f in files)),
+                        'stages': {stage: summarize(samples) for stage, samples in timings.items()}
+                    }
+        finally:
+            if persist:
+                database.close_database_connections()
+            os.chdir(cwd)
+
+    return {
+        'metadata': {
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'iterations': iterations,
+            'seed': seed,
+            'templates': TEMPLATES,
+            'role': f"{DEFAULT_CATEGORY} / {DEFAULT_ROLE}",
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%S')
+        },
+        'results': results
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time each stage of resume analysis on synthetic resumes")
+    parser.add_argument('--iterations', type=int, default=20, help="Passes over the generated corpus")
+    parser.add_argument('--seed', type=int, default=0, help="Seed for the synthetic resume generator")
+    parser.add_argument('--sizes', nargs='+', choices=list(SIZES), help="Resume sizes to include")
+    parser.add_argument('--formats', nargs='+', choices=FORMATS, default=list(FORMATS), help="File formats to include")
+    parser.add_argument('--no-db', action='store_true', help="Skip the database persistence stage")
+    parser.add_argument('--output', help="Write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run(args.iterations, args.seed, args.sizes, args.formats, persist=not args.no_db)
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(payload + '\n')
+        for key, result in report['results'].items():
+            stages = result['stages']
+            print(f"{key:>14}: extraction p50 {stages['extraction']['p50_ms']:.2f} ms, "
+                  f"analyze_resume p50 {stages['analyze_resume']['p50_ms']:.2f} ms")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Deterministic synthetic resumes for benchmarking, rendered through ResumeBuilder templates
+"""
+import contextlib
+import io
+import random
+
+from utils.document_ingestion import load_document
+from utils.resume_builder import ResumeBuilder
+
+# (experiences, projects, education entries, skills per category, bullets per entry)
+SIZES = {
+    'small': (1, 1, 1, 3, 2),
+    'typical': (4, 3, 2, 8, 4),
+    'huge': (40, 30, 6, 60, 12)
+}
+
+TEMPLATES = ['Modern', 'Professional', 'Minimal', 'Creative']
+
+_FIRST_NAMES = ['Aarav', 'Maya', 'Chen', 'Lucia', 'Omar', 'Priya', 'Jonas', 'Amara']
+_LAST_NAMES = ['Sharma', 'Okafor', 'Li', 'Garcia', 'Haddad', 'Nair', 'Berg', 'Mensah']
+_COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Stark Systems', 'Wayne Analytics']
+_POSITIONS = ['Software Engineer', 'Data Analyst', 'Backend Developer', 'DevOps Engineer', 'ML Engineer']
+_SCHOOLS = ['State University', 'City College', 'Institute of Technology', 'National University']
+_DEGREES = ['Bachelor of Technology', 'Master of Science', 'Bachelor of Engineering', 'MBA']
+_FIELDS = ['Computer Science', 'Information Technology', 'Data Science', 'Electronics']
+_VERBS = ['Developed', 'Managed', 'Created', 'Implemented', 'Designed', 'Led', 'Improved']
+_OBJECTS = ['a streaming data pipeline', 'REST APIs for billing', 'the CI/CD workflow', 'a React dashboard',
+            'Kubernetes deployments', 'SQL reporting jobs', 'a recommendation model', 'monitoring and alerting']
+_TECHNICAL = ['Python', 'Java', 'SQL', 'React', 'Docker', 'Kubernetes', 'AWS', 'Django', 'Flask', 'Node.js',
+              'TensorFlow', 'PyTorch', 'Git', 'Linux', 'Azure', 'GCP', 'HTML', 'CSS', 'JavaScript', 'Statistics']
+_SOFT = ['Communication', 'Leadership', 'Problem-solving', 'Teamwork', 'Time management', 'Mentoring']
+_TOOLS = ['Jira', 'Figma', 'Tableau', 'Excel', 'Postman', 'Grafana', 'Terraform']
+_LANGUAGES = ['English', 'Hindi', 'Spanish', 'German', 'French', 'Tamil']
+
+
+def _pick(rng, items, count):
+    return [items[rng.randrange(len(items))] for _ in range(count)]
+
+
+def _sentence(rng):
+    return f"{rng.choice(_VERBS)} {rng.choice(_OBJECTS)}, improving throughput by {rng.randint(10, 90)}%"
+
+
+def generate_resume_data(size='typical', seed=0, template='Modern'):
+    """Build a ResumeBuilder input dict of the given size"""
+    experiences, projects, educations, skills_per_category, bullets = SIZES[size]
+    rng = random.Random(f"{size}-{seed}")
+    first, last = rng.choice(_FIRST_NAMES), rng.choice(_LAST_NAMES)
+    start_year = rng.randint(2005, 2015)
+
+    return {
+        'personal_info': {
+            'full_name': f"{first} {last}",
+            'email': f"{first.lower()}.{last.lower()}@example.com",
+            'phone': f"555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+            'location': 'Bengaluru, India',
+            'linkedin': f"linkedin.com/in/{first.lower()}{last.lower()}",
+            'portfolio': f"github.com/{first.lower()}{last.lower()}"
+        },
+        'summary': ' '.join(_sentence(rng) + '.' for _ in range(3)),
+        'experience': [
+            {
+                'position': rng.choice(_POSITIONS),
+                'company': rng.choice(_COMPANIES),
+                'start_date': str(start_year + i),
+                'end_date': str(start_year + i + 1),
+                'description': _sentence(rng),
+                'responsibilities': [_sentence(rng) for _ in range(bullets)],
+                'achievements': [_sentence(rng) for _ in range(max(1, bullets // 2))]
+            }
+            for i in range(experiences)
+        ],
+        'projects': [
+            {
+                'name': f"Project {i + 1}",
+                'technologies': ', '.join(_pick(rng, _TECHNICAL, 3)),
+                'description': _sentence(rng),
+                'responsibilities': [_sentence(rng) for _ in range(bullets)],
+                'achievements': [_sentence(rng)],
+                'link': ''
+            }
+            for i in range(projects)
+        ],
+        'education': [
+            {
+                'school': rng.choice(_SCHOOLS),
+                'degree': rng.choice(_DEGREES),
+                'field': rng.choice(_FIELDS),
+                'graduation_date': str(start_year - i),
+                'gpa': f"{rng.uniform(3.0, 4.0):.1f}",
+                'achievements': [_sentence(rng)]
+            }
+            for i in range(educations)
+        ],
+        'skills': {
+            'technical': _pick(rng, _TECHNICAL, skills_per_category),
+            'soft': _pick(rng, _SOFT, max(2, skills_per_category // 2)),
+            'languages': _pick(rng, _LANGUAGES, 2),
+            'tools': _pick(rng, _TOOLS, max(2, skills_per_category // 2))
+        },
+        'template': template
+    }
+
+
+def render_docx(data):
+    """Render resume data to DOCX bytes with ResumeBuilder (its progress output is silenced)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        buffer = ResumeBuilder().generate_resume(data)
+    return buffer.getvalue()
+
+
+def _pdf_escape(line):
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def render_pdf(text, lines_per_page=50):
+    """Write text into a minimal multi-page PDF (WinAnsi Helvetica, one text object per page)"""
+    lines = text.split('\n')
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    font_id = 3 + 2 * len(pages)
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        ("<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            ' '.join(f"{3 + 2 * i} 0 R" for i in range(len(pages))), len(pages))).encode()
+    ]
+    for i, page_lines in enumerate(pages):
+        objects.append((
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {4 + 2 * i} 0 R "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> >>"
+        ).encode())
+        content = "BT /F1 10 Tf 40 760 Td 14 TL " + ' '.join(f"({_pdf_escape(line)}) '" for line in page_lines) + " ET"
+        content = content.encode('cp1252', 'replace')
+        objects.append(b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+
+    output = io.BytesIO()
+    output.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(output.tell())
+        output.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+    xref = output.tell()
+    output.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    output.write(b''.join(b"%010d 00000 n \n" % offset for offset in offsets))
+    output.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return output.getvalue()
+
+
+def generate_resume_files(size='typical', seed=0, template='Modern'):
+    """Return {'docx': bytes, 'pdf': bytes, 'txt': bytes} for one synthetic resume
+
+    The DOCX comes from ResumeBuilder; its extracted text is what the PDF
+    and plain-text variants contain, so all three carry the same content
+    (the PDF's standard font has no glyphs for the Creative template's emoji).
+    """
+    docx_bytes = render_docx(generate_resume_data(size, seed, template))
+    text = load_document(docx_bytes, name='resume.docx').text
+    return {
+        'docx': docx_bytes,
+        'pdf': render_pdf(text),
+        'txt': text.encode('utf-8')
+    }
@@ -1,181 +1,728 @@
+import ast
+import json
+import re
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
 
-def get_database_connection():
-    """Create and return a database connection"""
-    conn = sqlite3.connect('resume_data.db')
-    return conn
+from config.skill_categories import DEFAULT_SKILL_GROUP, categorize_skill
+
+DB_PATH = 'resume_data.db'
+
+# ATS score at which the dashboard counts a resume as high scoring
+HIGH_ATS_SCORE = 70
+
+# Seconds a writer waits on a locked database before raising "database is locked"
+BUSY_TIMEOUT = 30.0
+
+# Applied to every new connection; journal_mode=WAL lets readers run alongside a writer
+CONNECTION_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA cache_size=-16000',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA temp_store=MEMORY'
+)
+
+# Idle connections a pool keeps open for reuse
+MAX_IDLE_CONNECTIONS = 8
+
+class ConnectionPool:
+    """Hands out reusable SQLite connections for a database file
+    
+    A thread checks a connection out for its outermost connection() block
+    and returns it afterwards; up to max_idle idle connections are kept, so
+    a later block, on this or any other thread (Streamlit may run a rerun on
+    a new script thread), skips connect and pragma setup.
+    """
+    
+    def __init__(self, db_path, busy_timeout=BUSY_TIMEOUT, max_idle=MAX_IDLE_CONNECTIONS):
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self.max_idle = max_idle
+        self._lock = threading.Lock()
+        self._idle = []
+        self._generation = 0  # bumped by close_all so checked-out connections are not returned
+        self._local = threading.local()  # [connection, nesting depth, generation] of this thread
+    
+    def _open(self):
+        # check_same_thread is off because a connection moves between threads through the idle list
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout, check_same_thread=False)
+        conn.execute(f'PRAGMA busy_timeout={int(self.busy_timeout * 1000)}')
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    def _acquire(self):
+        entry = getattr(self._local, 'entry', None)
+        if entry is None:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+                generation = self._generation
+            entry = self._local.entry = [conn or self._open(), 0, generation]
+        return entry
+    
+    def _release(self, entry):
+        self._local.entry = None
+        with self._lock:
+            if entry[2] == self._generation and len(self._idle) < self.max_idle:
+                self._idle.append(entry[0])
+                return
+        entry[0].close()
+    
+    @contextmanager
+    def connection(self):
+        """Yield a pooled connection, committing on success and rolling back on error
+        
+        Nested blocks on a thread share the outer connection and transaction;
+        only the outermost block commits or rolls back, then returns it.
+        """
+        entry = self._acquire()
+        conn = entry[0]
+        entry[1] += 1
+        try:
+            yield conn
+            if entry[1] == 1:
+                conn.commit()
+        except Exception:
+            if entry[1] == 1:
+                conn.rollback()
+            raise
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                self._release(entry)
+    
+    def close_all(self):
+        """Close every idle connection; connections in use are closed when returned"""
+        with self._lock:
+            self._generation += 1
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+def get_connection_pool(db_path=DB_PATH):
+    """Return the shared pool for a database file"""
+    pool = _pools.get(db_path)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.setdefault(db_path, ConnectionPool(db_path))
+    return pool
+
+def get_database_connection(db_path=DB_PATH):
+    """Context manager yielding a pooled connection to the database"""
+    return get_connection_pool(db_path).connection()
+
+_data_version = 0
+_data_version_lock = threading.Lock()
+
+def get_data_version():
+    """Counter that goes up after every committed write the dashboard reads from"""
+    return _data_version
+
+def bump_data_version():
+    """Mark cached query results built before this point as stale"""
+    global _data_version
+    with _data_version_lock:
+        _data_version += 1
+
+def close_database_connections():
+    """Close the pooled connections of every database"""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close_all()
 
 def init_database():
     """Initialize database tables"""
-    conn = get_database_connection()
-    cursor = conn.cursor()
+    with get_database_connection() as conn:
+        cursor = conn.cursor()
+        
+        # Create resume_data table
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS resume_data (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            email TEXT NOT NULL,
+            phone TEXT NOT NULL,
+            linkedin TEXT,
+            github TEXT,
+            portfolio TEXT,
+            summary TEXT,
+            target_role TEXT,
+            target_category TEXT,
+            education TEXT,
+            experience TEXT,
+            projects TEXT,
+            skills TEXT,
+            template TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''')
+        
+        # Create resume_skills table
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS resume_skills (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            resume_id INTEGER,
+            skill_name TEXT NOT NULL,
+            skill_category TEXT NOT NULL,
+            proficiency_score REAL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (resume_id) REFERENCES resume_data (id)
+        )
+        ''')
+        
+        # Create resume_analysis table
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS resume_analysis (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            resume_id INTEGER,
+            ats_score REAL,
+            keyword_match_score REAL,
+            format_score REAL,
+            section_score REAL,
+            missing_skills TEXT,
+            recommendations TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (resume_id) REFERENCES resume_data (id)
+        )
+        ''')
+        
+        # Create analysis_cache table (see utils/analysis_cache.py)
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS analysis_cache (
+            cache_key TEXT PRIMARY KEY,
+            analysis TEXT NOT NULL,
+            resume_id INTEGER,
+            last_accessed REAL NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (resume_id) REFERENCES resume_data (id)
+        )
+        ''')
+        cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_analysis_cache_last_accessed
+        ON analysis_cache (last_accessed)
+        ''')
+        
+        # Create admin_logs table
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS admin_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            admin_email TEXT NOT NULL,
+            action TEXT NOT NULL,
+            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''')
+        
+        # Create admin table
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS admin (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email TEXT NOT NULL UNIQUE,
+            password TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''')
     
-    # Create resume_data table
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS resume_data (
+    migrate_database()
+
+def _add_hot_query_indexes(conn):
+    # The dashboard joins analyses to resumes and filters both tables by date
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_resume_analysis_resume_id ON resume_analysis (resume_id)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_resume_analysis_created_at ON resume_analysis (created_at)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_resume_data_created_at ON resume_data (created_at)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_resume_data_target_category ON resume_data (target_category)')
+
+def _add_skill_catalog(conn):
+    # Canonical skills; resume_skills rows point at them through skill_id
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS skills (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
-        name TEXT NOT NULL,
-        email TEXT NOT NULL,
-        phone TEXT NOT NULL,
-        linkedin TEXT,
-        github TEXT,
-        portfolio TEXT,
-        summary TEXT,
-        target_role TEXT,
-        target_category TEXT,
-        education TEXT,
-        experience TEXT,
-        projects TEXT,
-        skills TEXT,
-        template TEXT,
+        name TEXT NOT NULL UNIQUE,
+        display_name TEXT NOT NULL,
         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
     )
     ''')
+    conn.execute('ALTER TABLE resume_skills ADD COLUMN skill_id INTEGER REFERENCES skills (id)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_resume_skills_skill_id ON resume_skills (skill_id)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_resume_skills_resume_id ON resume_skills (resume_id)')
+
+def _add_daily_rollups(conn):
+    # One row per (day, category) kept current by triggers, so the dashboard reads
+    # O(days) rows instead of joining every resume; resume tables are append-only
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS daily_resume_stats (
+        day TEXT NOT NULL,
+        target_category TEXT NOT NULL,
+        resume_count INTEGER NOT NULL DEFAULT 0,
+        analysis_count INTEGER NOT NULL DEFAULT 0,
+        ats_score_sum REAL NOT NULL DEFAULT 0,
+        keyword_score_sum REAL NOT NULL DEFAULT 0,
+        high_scoring_count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, target_category)
+    ) WITHOUT ROWID
+    ''')
+    conn.execute('''
+    CREATE TRIGGER IF NOT EXISTS trg_resume_data_daily_stats
+    AFTER INSERT ON resume_data
+    BEGIN
+        INSERT INTO daily_resume_stats (day, target_category, resume_count)
+        VALUES (DATE(NEW.created_at), COALESCE(NEW.target_category, 'Other'), 1)
+        ON CONFLICT (day, target_category) DO UPDATE SET resume_count = resume_count + 1;
+    END
+    ''')
+    conn.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS trg_resume_analysis_daily_stats
+    AFTER INSERT ON resume_analysis
+    BEGIN
+        INSERT INTO daily_resume_stats (
+            day, target_category, analysis_count, ats_score_sum, keyword_score_sum, high_scoring_count
+        )
+        SELECT DATE(rd.created_at), COALESCE(rd.target_category, 'Other'), 1,
+               COALESCE(NEW.ats_score, 0), COALESCE(NEW.keyword_match_score, 0),
+               COALESCE(NEW.ats_score, 0) >= {HIGH_ATS_SCORE}
+        FROM resume_data rd
+        WHERE rd.id = NEW.resume_id
+        ON CONFLICT (day, target_category) DO UPDATE SET
+            analysis_count = analysis_count + 1,
+            ats_score_sum = ats_score_sum + excluded.ats_score_sum,
+            keyword_score_sum = keyword_score_sum + excluded.keyword_score_sum,
+            high_scoring_count = high_scoring_count + excluded.high_scoring_count;
+    END
+    ''')
     
-    # Create resume_skills table
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS resume_skills (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        resume_id INTEGER,
-        skill_name TEXT NOT NULL,
-        skill_category TEXT NOT NULL,
-        proficiency_score REAL,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        FOREIGN KEY (resume_id) REFERENCES resume_data (id)
+    # Seed the rollups from the rows saved before the triggers existed
+    conn.execute('''
+    INSERT INTO daily_resume_stats (day, target_category, resume_count)
+    SELECT DATE(created_at), COALESCE(target_category, 'Other'), COUNT(*)
+    FROM resume_data
+    WHERE true
+    GROUP BY 1, 2
+    ''')
+    conn.execute(f'''
+    INSERT INTO daily_resume_stats (
+        day, target_category, analysis_count, ats_score_sum, keyword_score_sum, high_scoring_count
     )
+    SELECT DATE(rd.created_at), COALESCE(rd.target_category, 'Other'), COUNT(*),
+           COALESCE(SUM(ra.ats_score), 0), COALESCE(SUM(ra.keyword_match_score), 0),
+           SUM(COALESCE(ra.ats_score, 0) >= {HIGH_ATS_SCORE})
+    FROM resume_analysis ra
+    JOIN resume_data rd ON rd.id = ra.resume_id
+    WHERE true
+    GROUP BY 1, 2
+    ON CONFLICT (day, target_category) DO UPDATE SET
+        analysis_count = excluded.analysis_count,
+        ats_score_sum = excluded.ats_score_sum,
+        keyword_score_sum = excluded.keyword_score_sum,
+        high_scoring_count = excluded.high_scoring_count
     ''')
-    
-    # Create resume_analysis table
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS resume_analysis (
+
+def _add_excel_resume_log(conn):
+    # Append-only store behind utils/excel_manager.ExcelManager; the .xlsx is
+    # materialized from it on demand instead of being rewritten on every save
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS excel_resume_log (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
-        resume_id INTEGER,
-        ats_score REAL,
-        keyword_match_score REAL,
-        format_score REAL,
-        section_score REAL,
-        missing_skills TEXT,
-        recommendations TEXT,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        FOREIGN KEY (resume_id) REFERENCES resume_data (id)
+        user_id TEXT,
+        job_role TEXT,
+        content TEXT,
+        analysis_data TEXT,
+        created_at TEXT NOT NULL
     )
     ''')
-    
-    # Create admin_logs table
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS admin_logs (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        admin_email TEXT NOT NULL,
-        action TEXT NOT NULL,
-        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_excel_resume_log_user_id ON excel_resume_log (user_id, id)')
+
+def _add_skill_counts(conn):
+    # skill -> resume count index for the dashboard's skill charts, kept current by a
+    # trigger on resume_skills; categories come from config/skill_categories.py
+    conn.execute('ALTER TABLE skills ADD COLUMN category TEXT')
+    conn.executemany('UPDATE skills SET category = ? WHERE id = ?', [
+        (categorize_skill(name), skill_id) for skill_id, name in conn.execute('SELECT id, name FROM skills').fetchall()
+    ])
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS skill_counts (
+        skill_id INTEGER PRIMARY KEY REFERENCES skills (id),
+        category TEXT NOT NULL,
+        resume_count INTEGER NOT NULL DEFAULT 0,
+        last_seen TIMESTAMP
     )
     ''')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_skill_counts_resume_count ON skill_counts (resume_count)')
+    conn.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS trg_resume_skills_counts
+    AFTER INSERT ON resume_skills
+    WHEN NEW.skill_id IS NOT NULL
+    BEGIN
+        INSERT INTO skill_counts (skill_id, category, resume_count, last_seen)
+        SELECT s.id, COALESCE(s.category, '{DEFAULT_SKILL_GROUP}'), 1, COALESCE(NEW.created_at, CURRENT_TIMESTAMP)
+        FROM skills s
+        WHERE s.id = NEW.skill_id
+        ON CONFLICT (skill_id) DO UPDATE SET
+            resume_count = resume_count + 1,
+            last_seen = MAX(COALESCE(last_seen, ''), excluded.last_seen);
+    END
+    ''')
     
-    # Create admin table
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS admin (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        email TEXT NOT NULL UNIQUE,
-        password TEXT NOT NULL,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    # Seed from the skills indexed before the trigger existed
+    conn.execute(f'''
+    INSERT INTO skill_counts (skill_id, category, resume_count, last_seen)
+    SELECT s.id, COALESCE(s.category, '{DEFAULT_SKILL_GROUP}'), COUNT(*), MAX(rs.created_at)
+    FROM resume_skills rs
+    JOIN skills s ON s.id = rs.skill_id
+    GROUP BY s.id
+    ''')
+
+def _add_excel_compactions(conn):
+    # Highest excel_resume_log id already written to each workbook, so
+    # ExcelManager can compact after a fixed number of new rows
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS excel_compactions (
+        excel_file TEXT PRIMARY KEY,
+        last_log_id INTEGER NOT NULL,
+        compacted_at TEXT NOT NULL
     )
     ''')
+
+# Ordered schema changes applied on top of the tables created by init_database.
+# Append new (version, description, step) entries; never edit or reorder applied ones.
+MIGRATIONS = [
+    (1, 'Index resume_analysis.resume_id and the created_at/target_category filters', _add_hot_query_indexes),
+    (2, 'Add the skills catalog and resume_skills.skill_id', _add_skill_catalog),
+    (3, 'Add daily_resume_stats rollups maintained by insert triggers', _add_daily_rollups),
+    (4, 'Add the append-only excel_resume_log behind ExcelManager', _add_excel_resume_log),
+    (5, 'Add skills.category and the skill_counts index maintained by a trigger', _add_skill_counts),
+    (6, 'Track the log id each ExcelManager workbook was compacted through', _add_excel_compactions),
+]
+
+def get_schema_version():
+    """Return the highest applied migration version (0 for a fresh database)"""
+    with get_database_connection() as conn:
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            description TEXT NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''')
+        return conn.execute('SELECT COALESCE(MAX(version), 0) FROM schema_version').fetchone()[0]
+
+def migrate_database():
+    """Apply pending MIGRATIONS in order, each in its own write transaction
+    
+    BEGIN IMMEDIATE takes the write lock before the version check, so two
+    processes starting together cannot apply the same step twice.
+    """
+    current_version = get_schema_version()
+    with get_database_connection() as conn:
+        for version, description, step in MIGRATIONS:
+            if version <= current_version:
+                continue
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                applied = conn.execute('SELECT 1 FROM schema_version WHERE version = ?', (version,)).fetchone()
+                if not applied:
+                    step(conn)
+                    conn.execute('INSERT INTO schema_version (version, description) VALUES (?, ?)',
+                                 (version, description))
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+    return get_schema_version()
+
+def explain_query_plan(query, params=()):
+    """Return the EXPLAIN QUERY PLAN detail lines for a query, e.g. to check an index is used"""
+    with get_database_connection() as conn:
+        return [row[-1] for row in conn.execute(f'EXPLAIN QUERY PLAN {query}', params).fetchall()]
+
+# Category recorded for skills saved as a flat list (the analyzer's output)
+DEFAULT_SKILL_CATEGORY = 'general'
+
+def canonical_skill_name(skill):
+    """Normalize a skill name for matching: trimmed, single-spaced and lowercase"""
+    return re.sub(r'\s+', ' ', str(skill).strip(' \t\r\n[]\'"•*')).lower()
+
+def iter_skills(skills):
+    """Yield (skill, category) from a skills list or a {category: skills} dict"""
+    if isinstance(skills, dict):
+        groups = skills.items()
+    else:
+        groups = [(DEFAULT_SKILL_CATEGORY, skills)]
+    for category, values in groups:
+        if isinstance(values, str):
+            values = values.split(',')
+        for value in values or []:
+            if canonical_skill_name(value):
+                yield str(value).strip(), category
+
+RESUME_INSERT = '''
+INSERT INTO resume_data (
+    name, email, phone, linkedin, github, portfolio,
+    summary, target_role, target_category, education, 
+    experience, projects, skills, template
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+ANALYSIS_INSERT = '''
+INSERT INTO resume_analysis (
+    resume_id, ats_score, keyword_match_score,
+    format_score, section_score, missing_skills,
+    recommendations
+) VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+def _resume_row(data):
+    personal_info = data.get('personal_info', {})
+    return (
+        personal_info.get('full_name', ''),
+        personal_info.get('email', ''),
+        personal_info.get('phone', ''),
+        personal_info.get('linkedin', ''),
+        personal_info.get('github', ''),
+        personal_info.get('portfolio', ''),
+        data.get('summary', ''),
+        data.get('target_role', ''),
+        data.get('target_category', ''),
+        json.dumps(data.get('education', [])),
+        json.dumps(data.get('experience', [])),
+        json.dumps(data.get('projects', [])),
+        json.dumps(data.get('skills', [])),
+        data.get('template', '')
+    )
+
+def _analysis_row(resume_id, analysis):
+    return (
+        resume_id,
+        float(analysis.get('ats_score', 0)),
+        float(analysis.get('keyword_match_score', 0)),
+        float(analysis.get('format_score', 0)),
+        float(analysis.get('section_score', 0)),
+        analysis.get('missing_skills', ''),
+        analysis.get('recommendations', '')
+    )
+
+def _save_resume_skills(cursor, resume_skills):
+    """Write one resume_skills row per distinct skill of each (resume_id, skills) pair
     
-    conn.commit()
-    conn.close()
+    Catalog entries are created as needed. Returns how many resumes had skills.
+    """
+    rows = []
+    catalog = {}
+    for resume_id, skills in resume_skills:
+        seen = set()
+        for skill, category in iter_skills(skills):
+            name = canonical_skill_name(skill)
+            if name not in seen:
+                seen.add(name)
+                catalog.setdefault(name, skill)
+                rows.append((resume_id, name, skill, category))
+    if not rows:
+        return 0
+    
+    cursor.executemany('INSERT OR IGNORE INTO skills (name, display_name, category) VALUES (?, ?, ?)', [
+        (name, display_name, categorize_skill(name)) for name, display_name in catalog.items()
+    ])
+    names = list(catalog)
+    skill_ids = {}
+    # Stay below SQLite's bound-parameter limit for very long skill lists
+    for i in range(0, len(names), 500):
+        chunk = names[i:i + 500]
+        cursor.execute(f"SELECT name, id FROM skills WHERE name IN ({','.join('?' * len(chunk))})", chunk)
+        skill_ids.update(cursor.fetchall())
+    cursor.executemany('''
+    INSERT INTO resume_skills (resume_id, skill_id, skill_name, skill_category)
+    VALUES (?, ?, ?, ?)
+    ''', [(resume_id, skill_ids[name], skill, category) for resume_id, name, skill, category in rows])
+    return len({row[0] for row in rows})
+
+def _insert_resumes(cursor, resumes):
+    """Insert resume_data rows with one executemany and return their ids in order
+    
+    Inside the write transaction AUTOINCREMENT hands out consecutive ids, so
+    they are derived from last_insert_rowid() and checked against the table.
+    """
+    if not resumes:
+        return []
+    cursor.executemany(RESUME_INSERT, [_resume_row(data) for data in resumes])
+    last_id = cursor.execute('SELECT last_insert_rowid()').fetchone()[0]
+    first_id = last_id - len(resumes) + 1
+    cursor.execute('SELECT COUNT(*) FROM resume_data WHERE id BETWEEN ? AND ?', (first_id, last_id))
+    if cursor.fetchone()[0] != len(resumes):
+        raise sqlite3.DatabaseError("Inserted resume ids are not consecutive")
+    resume_ids = list(range(first_id, last_id + 1))
+    _save_resume_skills(cursor, [(resume_id, data.get('skills', [])) for resume_id, data in zip(resume_ids, resumes)])
+    return resume_ids
 
 def save_resume_data(data):
     """Save resume data to database"""
-    conn = get_database_connection()
-    cursor = conn.cursor()
-    
     try:
-        personal_info = data.get('personal_info', {})
-        
-        cursor.execute('''
-        INSERT INTO resume_data (
-            name, email, phone, linkedin, github, portfolio,
-            summary, target_role, target_category, education, 
-            experience, projects, skills, template
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            personal_info.get('full_name', ''),
-            personal_info.get('email', ''),
-            personal_info.get('phone', ''),
-            personal_info.get('linkedin', ''),
-            personal_info.get('github', ''),
-            personal_info.get('portfolio', ''),
-            data.get('summary', ''),
-            data.get('target_role', ''),
-            data.get('target_category', ''),
-            str(data.get('education', [])),
-            str(data.get('experience', [])),
-            str(data.get('projects', [])),
-            str(data.get('skills', [])),
-            data.get('template', '')
-        ))
-        
-        conn.commit()
-        return cursor.lastrowid
+        with get_database_connection() as conn:
+            resume_id = _insert_resumes(conn.cursor(), [data])[0]
+        bump_data_version()
+        return resume_id
     except Exception as e:
         print(f"Error saving resume data: {str(e)}")
-        conn.rollback()
         return None
-    finally:
-        conn.close()
 
 def save_analysis_data(resume_id, analysis):
     """Save resume analysis data"""
-    conn = get_database_connection()
-    cursor = conn.cursor()
-    
     try:
-        cursor.execute('''
-        INSERT INTO resume_analysis (
-            resume_id, ats_score, keyword_match_score,
-            format_score, section_score, missing_skills,
-            recommendations
-        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            resume_id,
-            float(analysis.get('ats_score', 0)),
-            float(analysis.get('keyword_match_score', 0)),
-            float(analysis.get('format_score', 0)),
-            float(analysis.get('section_score', 0)),
-            analysis.get('missing_skills', ''),
-            analysis.get('recommendations', '')
-        ))
-        
-        conn.commit()
+        with get_database_connection() as conn:
+            conn.execute(ANALYSIS_INSERT, _analysis_row(resume_id, analysis))
+        bump_data_version()
     except Exception as e:
         print(f"Error saving analysis data: {str(e)}")
-        conn.rollback()
-    finally:
-        conn.close()
+
+def save_resume_batch(entries):
+    """Save many (resume_data, analysis) pairs in a single transaction"""
+    try:
+        with get_database_connection() as conn:
+            cursor = conn.cursor()
+            resume_ids = _insert_resumes(cursor, [data for data, _ in entries])
+            cursor.executemany(ANALYSIS_INSERT, [
+                _analysis_row(resume_id, analysis)
+                for resume_id, (_, analysis) in zip(resume_ids, entries)
+            ])
+        bump_data_version()
+        return resume_ids
+    except Exception as e:
+        print(f"Error saving resume batch: {str(e)}")
+        return []
+
+class ResumeWriteBuffer:
+    """Write-behind buffer for bulk ingestion of (resume_data, analysis) pairs
+    
+    Rows are held in memory and written by save_resume_batch, one transaction
+    per flush, once batch_size rows are pending or flush_interval seconds have
+    passed since the last flush (checked on add). Use as a context manager,
+    or call flush() when done, so the tail of the buffer is written.
+    """
+    
+    def __init__(self, batch_size=200, flush_interval=5.0):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+    
+    def __len__(self):
+        return len(self._pending)
+    
+    def add(self, resume_data, analysis):
+        """Queue one pair; returns the resume ids written if this triggered a flush, else []"""
+        with self._lock:
+            self._pending.append((resume_data, analysis))
+            due = (len(self._pending) >= self.batch_size
+                   or time.monotonic() - self._last_flush >= self.flush_interval)
+        return self.flush() if due else []
+    
+    def flush(self):
+        """Write every pending pair in one transaction and return their resume ids in order
+        
+        On failure the rows stay queued and RuntimeError is raised, so the
+        caller can retry.
+        """
+        with self._lock:
+            entries = self._pending
+            self._last_flush = time.monotonic()
+            if not entries:
+                return []
+            resume_ids = save_resume_batch(entries)
+            if len(resume_ids) != len(entries):
+                raise RuntimeError(f"Failed to save a batch of {len(entries)} resumes")
+            self._pending = []
+            return resume_ids
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+
+def parse_stored_value(text):
+    """Decode a structured column written either as JSON or by the old str(list) format"""
+    if not text:
+        return []
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return [part.strip() for part in text.split(',') if part.strip()]
+
+def backfill_resume_data(batch_size=500):
+    """Rewrite legacy str(list) columns as JSON and fill resume_skills for older rows
+    
+    Rows are walked in id order and each batch commits on its own, so the job
+    can be stopped and rerun; already-converted rows are left untouched.
+    Returns (rows converted, resumes given skills).
+    """
+    columns = ('education', 'experience', 'projects', 'skills')
+    converted = 0
+    skilled = 0
+    last_id = 0
+    while True:
+        with get_database_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+            SELECT id, education, experience, projects, skills,
+                   EXISTS (SELECT 1 FROM resume_skills rs WHERE rs.resume_id = resume_data.id)
+            FROM resume_data
+            WHERE id > ?
+            ORDER BY id
+            LIMIT ?
+            ''', (last_id, batch_size))
+            rows = cursor.fetchall()
+            if not rows:
+                break
+            
+            updates = []
+            missing_skills = []
+            for row in rows:
+                resume_id, values, has_skills = row[0], row[1:5], row[5]
+                parsed = [parse_stored_value(value) for value in values]
+                encoded = [json.dumps(value) for value in parsed]
+                if list(values) != encoded:
+                    updates.append((*encoded, resume_id))
+                if not has_skills:
+                    missing_skills.append((resume_id, parsed[3]))
+            skilled += _save_resume_skills(cursor, missing_skills)
+            cursor.executemany(f"UPDATE resume_data SET {', '.join(c + ' = ?' for c in columns)} WHERE id = ?",
+                               updates)
+            converted += len(updates)
+            last_id = rows[-1][0]
+    bump_data_version()
+    return converted, skilled
 
 def get_resume_stats():
     """Get statistics about resumes"""
-    conn = get_database_connection()
-    cursor = conn.cursor()
-    
     try:
-        # Get total resumes
-        cursor.execute('SELECT COUNT(*) FROM resume_data')
-        total_resumes = cursor.fetchone()[0]
-        
-        # Get average ATS score
-        cursor.execute('SELECT AVG(ats_score) FROM resume_analysis')
-        avg_ats_score = cursor.fetchone()[0] or 0
-        
-        # Get recent activity
-        cursor.execute('''
-        SELECT name, target_role, created_at 
-        FROM resume_data 
-        ORDER BY created_at DESC 
-        LIMIT 5
-        ''')
-        recent_activity = cursor.fetchall()
+        with get_database_connection() as conn:
+            cursor = conn.cursor()
+            
+            # Get total resumes
+            cursor.execute('SELECT COUNT(*) FROM resume_data')
+            total_resumes = cursor.fetchone()[0]
+            
+            # Get average ATS score
+            cursor.execute('SELECT AVG(ats_score) FROM resume_analysis')
+            avg_ats_score = cursor.fetchone()[0] or 0
+            
+            # Get recent activity
+            cursor.execute('''
+            SELECT name, target_role, created_at 
+            FROM resume_data 
+            ORDER BY created_at DESC 
+            LIMIT 5
+            ''')
+            recent_activity = cursor.fetchall()
         
         return {
             'total_resumes': total_resumes,
@@ -185,103 +732,78 @@ def get_resume_stats():
     except Exception as e:
         print(f"Error getting resume stats: {str(e)}")
         return None
-    finally:
-        conn.close()
 
 def log_admin_action(admin_email, action):
     """Log admin login/logout actions"""
-    conn = get_database_connection()
-    cursor = conn.cursor()
-    
     try:
-        cursor.execute('''
-        INSERT INTO admin_logs (admin_email, action)
-        VALUES (?, ?)
-        ''', (admin_email, action))
-        conn.commit()
+        with get_database_connection() as conn:
+            conn.execute('''
+            INSERT INTO admin_logs (admin_email, action)
+            VALUES (?, ?)
+            ''', (admin_email, action))
+        bump_data_version()
     except Exception as e:
         print(f"Error logging admin action: {str(e)}")
-    finally:
-        conn.close()
 
 def get_admin_logs():
     """Get all admin login/logout logs"""
-    conn = get_database_connection()
-    cursor = conn.cursor()
-    
     try:
-        cursor.execute('''
-        SELECT admin_email, action, timestamp
-        FROM admin_logs
-        ORDER BY timestamp DESC
-        ''')
-        return cursor.fetchall()
+        with get_database_connection() as conn:
+            return conn.execute('''
+            SELECT admin_email, action, timestamp
+            FROM admin_logs
+            ORDER BY timestamp DESC
+            ''').fetchall()
     except Exception as e:
         print(f"Error getting admin logs: {str(e)}")
         return []
-    finally:
-        conn.close()
 
 def get_all_resume_data():
     """Get all resume data for admin dashboard"""
-    conn = get_database_connection()
-    cursor = conn.cursor()
-    
     try:
-        # Get resume data joined with analysis data
-        cursor.execute('''
-        SELECT 
-            r.id,
-            r.name,
-            r.email,
-            r.phone,
-            r.linkedin,
-            r.github,
-            r.portfolio,
-            r.target_role,
-            r.target_category,
-            r.created_at,
-            a.ats_score,
-            a.keyword_match_score,
-            a.format_score,
-            a.section_score
-        FROM resume_data r
-        LEFT JOIN resume_analysis a ON r.id = a.resume_id
-        ORDER BY r.created_at DESC
-        ''')
-        return cursor.fetchall()
+        with get_database_connection() as conn:
+            # Get resume data joined with analysis data
+            return conn.execute('''
+            SELECT 
+                r.id,
+                r.name,
+                r.email,
+                r.phone,
+                r.linkedin,
+                r.github,
+                r.portfolio,
+                r.target_role,
+                r.target_category,
+                r.created_at,
+                a.ats_score,
+                a.keyword_match_score,
+                a.format_score,
+                a.section_score
+            FROM resume_data r
+            LEFT JOIN resume_analysis a ON r.id = a.resume_id
+            ORDER BY r.created_at DESC
+            ''').fetchall()
     except Exception as e:
         print(f"Error getting resume data: {str(e)}")
         return []
-    finally:
-        conn.close()
 
 def verify_admin(email, password):
     """Verify admin credentials"""
-    conn = get_database_connection()
-    cursor = conn.cursor()
-    
     try:
-        cursor.execute('SELECT * FROM admin WHERE email = ? AND password = ?', (email, password))
-        result = cursor.fetchone()
-        return bool(result)
+        with get_database_connection() as conn:
+            result = conn.execute('SELECT * FROM admin WHERE email = ? AND password = ?',
+                                  (email, password)).fetchone()
+            return bool(result)
     except Exception as e:
         print(f"Error verifying admin: {str(e)}")
         return False
-    finally:
-        conn.close()
 
 def add_admin(email, password):
     """Add a new admin"""
-    conn = get_database_connection()
-    cursor = conn.cursor()
-    
     try:
-        cursor.execute('INSERT INTO admin (email, password) VALUES (?, ?)', (email, password))
-        conn.commit()
+        with get_database_connection() as conn:
+            conn.execute('INSERT INTO admin (email, password) VALUES (?, ?)', (email, password))
         return True
     except Exception as e:
         print(f"Error adding admin: {str(e)}")
         return False
-    finally:
-        conn.close()
@@ -0,0 +1,18 @@
+# Dashboard skill categories, checked in order; a skill belongs to the first
+# category with a keyword contained in its canonical (lowercase) name
+SKILL_CATEGORIES = [
+    ("Programming", ["python", "java", "javascript", "c++", "programming"]),
+    ("Database", ["sql", "database", "mongodb"]),
+    ("Cloud", ["aws", "cloud", "azure"]),
+    ("Management", ["agile", "scrum", "management"]),
+]
+
+DEFAULT_SKILL_GROUP = "Other"
+
+def categorize_skill(name):
+    """Return the dashboard category of a skill name"""
+    name = name.lower()
+    for category, keywords in SKILL_CATEGORIES:
+        if any(keyword in name for keyword in keywords):
+            return category
+    return DEFAULT_SKILL_GROUP
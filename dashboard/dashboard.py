@@ -4,14 +4,50 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 from config.database import get_database_connection
+from dashboard.query_cache import cached_query, query_cache
+from utils.columnar_export import export_columnar
+from utils.streaming_export import (
+    RESUME_EXPORT_QUERY, RESUME_JSON_EXPORT_QUERY, export_csv, export_excel, export_json, export_ndjson
+)
 import io
 import uuid
 from plotly.subplots import make_subplots
 from io import BytesIO
 
+# SQL expression mapping a daily_resume_stats day to the first day of its bucket
+# (weeks start on Monday, like the 'This Week' metric)
+METRIC_BUCKETS = {
+    'day': "day",
+    'week': "DATE(day, '-' || ((CAST(STRFTIME('%w', day) AS INTEGER) + 6) % 7) || ' days')",
+    'month': "STRFTIME('%Y-%m-01', day)"
+}
+
+def bucket_starts(bucket, periods, now=None):
+    """First day of each of the last `periods` buckets, oldest first"""
+    today = (now or datetime.now()).date()
+    if bucket == 'day':
+        return [today - timedelta(days=i) for i in range(periods - 1, -1, -1)]
+    if bucket == 'week':
+        monday = today - timedelta(days=today.weekday())
+        return [monday - timedelta(weeks=i) for i in range(periods - 1, -1, -1)]
+    if bucket == 'month':
+        starts = []
+        year, month = today.year, today.month
+        for _ in range(periods):
+            starts.append(today.replace(year=year, month=month, day=1))
+            year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+        return starts[::-1]
+    raise ValueError(f"Unknown metric bucket: {bucket}")
+
+def _bucket_label(bucket, start, periods):
+    if bucket == 'day':
+        return start.strftime('%a' if periods <= 7 else '%b %d')
+    if bucket == 'week':
+        return start.strftime('Week of %b %d')
+    return start.strftime('%b %Y')
+
 class DashboardManager:
     def __init__(self):
-        self.conn = get_database_connection()
         self.colors = {
             'primary': '#4CAF50',
             'secondary': '#2196F3',
@@ -109,136 +145,148 @@ class DashboardManager:
             </style>
         """, unsafe_allow_html=True)
 
+    @cached_query
     def get_resume_metrics(self):
-        """Get resume-related metrics from database"""
-        cursor = self.conn.cursor()
+        """Get resume-related metrics from the daily rollups"""
+        with get_database_connection() as conn:
+            cursor = conn.cursor()
         
-        # Get current date
-        now = datetime.now()
-        start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        start_of_week = now - timedelta(days=now.weekday())
-        start_of_month = now.replace(day=1)
+            # Get current date
+            now = datetime.now()
+            start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            start_of_week = now - timedelta(days=now.weekday())
+            start_of_month = now.replace(day=1)
         
-        # Fetch metrics for different time periods
-        metrics = {}
-        for period, start_date in [
-            ('Today', start_of_day),
-            ('This Week', start_of_week),
-            ('This Month', start_of_month),
-            ('All Time', datetime(2000, 1, 1))
-        ]:
-            cursor.execute("""
-                SELECT 
-                    COUNT(DISTINCT rd.id) as total_resumes,
-                    ROUND(AVG(ra.ats_score), 1) as avg_ats_score,
-                    ROUND(AVG(ra.keyword_match_score), 1) as avg_keyword_score,
-                    COUNT(DISTINCT CASE WHEN ra.ats_score >= 70 THEN rd.id END) as high_scoring
-                FROM resume_data rd
-                LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-                WHERE rd.created_at >= ?
-            """, (start_date.strftime('%Y-%m-%d %H:%M:%S'),))
+            periods = [
+                ('Today', start_of_day),
+                ('This Week', start_of_week),
+                ('This Month', start_of_month),
+                ('All Time', datetime(2000, 1, 1))
+            ]
             
+            # One range scan over the rollups; each period is a conditional aggregate
+            columns, params = [], []
+            for _, start_date in periods:
+                columns.append("""
+                    SUM(CASE WHEN day >= ? THEN resume_count END),
+                    ROUND(SUM(CASE WHEN day >= ? THEN ats_score_sum END) /
+                          NULLIF(SUM(CASE WHEN day >= ? THEN analysis_count END), 0), 1),
+                    ROUND(SUM(CASE WHEN day >= ? THEN keyword_score_sum END) /
+                          NULLIF(SUM(CASE WHEN day >= ? THEN analysis_count END), 0), 1),
+                    SUM(CASE WHEN day >= ? THEN high_scoring_count END)
+                """)
+                params.extend([start_date.strftime('%Y-%m-%d')] * 6)
+            cursor.execute(
+                f"SELECT {','.join(columns)} FROM daily_resume_stats WHERE day >= ?",
+                params + [min(start_date for _, start_date in periods).strftime('%Y-%m-%d')]
+            )
             row = cursor.fetchone()
-            if row:
-                metrics[period] = {
-                    'total': row[0] or 0,
-                    'ats_score': row[1] or 0,
-                    'keyword_score': row[2] or 0,
-                    'high_scoring': row[3] or 0
-                }
-            else:
+        
+            metrics = {}
+            for i, (period, _) in enumerate(periods):
+                values = row[i * 4:i * 4 + 4]
                 metrics[period] = {
-                    'total': 0,
-                    'ats_score': 0,
-                    'keyword_score': 0,
-                    'high_scoring': 0
+                    'total': values[0] or 0,
+                    'ats_score': values[1] or 0,
+                    'keyword_score': values[2] or 0,
+                    'high_scoring': values[3] or 0
                 }
         
-        return metrics
+            return metrics
 
+    @cached_query
     def get_skill_distribution(self):
         """Get skill distribution data"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            WITH RECURSIVE split(skill, rest) AS (
-                SELECT '', skills || ','
-                FROM resume_data
-                UNION ALL
-                SELECT
-                    substr(rest, 0, instr(rest, ',')),
-                    substr(rest, instr(rest, ',') + 1)
-                FROM split
-                WHERE rest <> ''
-            ),
-            SkillCategories AS (
-                SELECT 
-                    CASE 
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%python%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%java%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%javascript%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%c++%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%programming%' THEN 'Programming'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%sql%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%database%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%mongodb%' THEN 'Database'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%aws%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%cloud%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%azure%' THEN 'Cloud'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%agile%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%scrum%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%management%' THEN 'Management'
-                        ELSE 'Other'
-                    END as category,
-                    COUNT(*) as count
-                FROM split
-                WHERE skill <> ''
+        with get_database_connection() as conn:
+            cursor = conn.cursor()
+            # skill_counts holds one row per canonical skill with its category
+            cursor.execute("""
+                SELECT category, SUM(resume_count) as count
+                FROM skill_counts
                 GROUP BY category
-            )
-            SELECT category, count
-            FROM SkillCategories
-            ORDER BY count DESC
-        """)
+                ORDER BY count DESC
+            """)
         
-        categories, counts = [], []
-        for row in cursor.fetchall():
-            categories.append(row[0])
-            counts.append(row[1])
+            categories, counts = [], []
+            for row in cursor.fetchall():
+                categories.append(row[0])
+                counts.append(row[1])
             
-        return categories, counts
+            return categories, counts
+
+    @cached_query
+    def get_bucketed_metrics(self, bucket='day', periods=7):
+        """Submission and score series for the last `periods` day/week/month buckets
+        
+        A single range scan over daily_resume_stats grouped by bucket, so the
+        cost follows the number of days in the window, not the number of buckets.
+        Buckets without submissions are filled with zeros.
+        """
+        if bucket not in METRIC_BUCKETS:
+            raise ValueError(f"Unknown metric bucket: {bucket}")
+        starts = bucket_starts(bucket, periods)
+        
+        with get_database_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT 
+                    {METRIC_BUCKETS[bucket]} as bucket,
+                    SUM(resume_count),
+                    SUM(analysis_count),
+                    ROUND(SUM(ats_score_sum) / NULLIF(SUM(analysis_count), 0), 1),
+                    ROUND(SUM(keyword_score_sum) / NULLIF(SUM(analysis_count), 0), 1),
+                    SUM(high_scoring_count)
+                FROM daily_resume_stats
+                WHERE day >= ?
+                GROUP BY bucket
+            """, (starts[0].strftime('%Y-%m-%d'),))
+            rows = {row[0]: row[1:] for row in cursor.fetchall()}
+        
+        series = {
+            'buckets': [start.strftime('%Y-%m-%d') for start in starts],
+            'labels': [_bucket_label(bucket, start, periods) for start in starts],
+            'submissions': [],
+            'analyses': [],
+            'avg_ats_score': [],
+            'avg_keyword_score': [],
+            'high_scoring': []
+        }
+        for key in series['buckets']:
+            submissions, analyses, ats_score, keyword_score, high_scoring = rows.get(key, (0, 0, None, None, 0))
+            series['submissions'].append(submissions or 0)
+            series['analyses'].append(analyses or 0)
+            series['avg_ats_score'].append(ats_score or 0)
+            series['avg_keyword_score'].append(keyword_score or 0)
+            series['high_scoring'].append(high_scoring or 0)
+        return series
 
     def get_weekly_trends(self):
         """Get weekly submission trends"""
-        cursor = self.conn.cursor()
-        now = datetime.now()
-        dates = [(now - timedelta(days=x)).strftime('%Y-%m-%d') for x in range(6, -1, -1)]
-        
-        submissions = []
-        for date in dates:
-            cursor.execute("""
-                SELECT COUNT(*) 
-                FROM resume_data 
-                WHERE DATE(created_at) = DATE(?)
-            """, (date,))
-            submissions.append(cursor.fetchone()[0])
-            
-        return [d[-3:] for d in dates], submissions  # Return shortened date format (e.g., 'Mon', 'Tue')
+        series = self.get_bucketed_metrics('day', 7)
+        return series['labels'], series['submissions']  # Weekday labels (e.g., 'Mon', 'Tue')
 
+    @cached_query
     def get_job_category_stats(self):
         """Get statistics by job category"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT 
-                COALESCE(target_category, 'Other') as category,
-                COUNT(*) as count,
-                ROUND(AVG(CASE WHEN ra.ats_score >= 70 THEN 1 ELSE 0 END) * 100, 1) as success_rate
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-            GROUP BY category
-            ORDER BY count DESC
-            LIMIT 5
-        """)
+        with get_database_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT 
+                    target_category as category,
+                    SUM(resume_count) as count,
+                    ROUND(SUM(high_scoring_count) * 100.0 / NULLIF(SUM(resume_count), 0), 1) as success_rate
+                FROM daily_resume_stats
+                GROUP BY category
+                ORDER BY count DESC
+                LIMIT 5
+            """)
         
-        categories, success_rates = [], []
-        for row in cursor.fetchall():
-            categories.append(row[0])
-            success_rates.append(row[2] or 0)
+            categories, success_rates = [], []
+            for row in cursor.fetchall():
+                categories.append(row[0])
+                success_rates.append(row[2] or 0)
             
-        return categories, success_rates
+            return categories, success_rates
 
     def render_admin_panel(self):
         """Render admin panel with data management tools"""
@@ -254,7 +302,7 @@ class DashboardManager:
         # Data Export Options
         export_format = st.sidebar.selectbox(
             "Export Format",
-            ["Excel", "CSV", "JSON"],
+            ["Excel", "CSV", "JSON", "NDJSON", "Parquet"],
             key="export_format"
         )
         
@@ -277,6 +325,24 @@ class DashboardManager:
                         file_name=f"resume_data_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
                         mime="text/csv"
                     )
+            elif export_format == "Parquet":
+                parquet_data = self.export_to_parquet()
+                if parquet_data:
+                    st.sidebar.download_button(
+                        "⬇️ Download Parquet",
+                        data=parquet_data,
+                        file_name=f"resume_data_{datetime.now().strftime('%Y%m%d_%H%M')}.parquet",
+                        mime="application/vnd.apache.parquet"
+                    )
+            elif export_format == "NDJSON":
+                ndjson_data = self.export_to_ndjson()
+                if ndjson_data:
+                    st.sidebar.download_button(
+                        "⬇️ Download NDJSON",
+                        data=ndjson_data,
+                        file_name=f"resume_data_{datetime.now().strftime('%Y%m%d_%H%M')}.ndjson",
+                        mime="application/x-ndjson"
+                    )
             else:
                 json_data = self.export_to_json()
                 if json_data:
@@ -295,35 +361,49 @@ class DashboardManager:
             - Today's Submissions: {stats['today_submissions']}
             - Storage Used: {stats['storage_size']}
         """)
+        
+        self.render_query_cache_stats()
 
+    def render_query_cache_stats(self):
+        """Show dashboard query cache effectiveness in the sidebar"""
+        stats = query_cache.stats()
+        st.sidebar.markdown("### ⚡ Query Cache")
+        st.sidebar.markdown(f"""
+            - Hit Rate: {stats['hit_rate'] * 100:.1f}% ({stats['hits']} hits / {stats['misses']} misses)
+            - Time Saved: {stats['time_saved'] * 1000:.0f} ms
+            - Cached Results: {stats['entries']}
+        """)
+
+    @cached_query
     def get_resume_data(self):
         """Get all resume data"""
-        cursor = self.conn.cursor()
-        try:
-            cursor.execute('''
-            SELECT 
-                r.id,
-                r.name,
-                r.email,
-                r.phone,
-                r.linkedin,
-                r.github,
-                r.portfolio,
-                r.target_role,
-                r.target_category,
-                r.created_at,
-                a.ats_score,
-                a.keyword_match_score,
-                a.format_score,
-                a.section_score
-            FROM resume_data r
-            LEFT JOIN resume_analysis a ON r.id = a.resume_id
-            ORDER BY r.created_at DESC
-            ''')
-            return cursor.fetchall()
-        except Exception as e:
-            print(f"Error fetching resume data: {str(e)}")
-            return []
+        with get_database_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute('''
+                SELECT 
+                    r.id,
+                    r.name,
+                    r.email,
+                    r.phone,
+                    r.linkedin,
+                    r.github,
+                    r.portfolio,
+                    r.target_role,
+                    r.target_category,
+                    r.created_at,
+                    a.ats_score,
+                    a.keyword_match_score,
+                    a.format_score,
+                    a.section_score
+                FROM resume_data r
+                LEFT JOIN resume_analysis a ON r.id = a.resume_id
+                ORDER BY r.created_at DESC
+                ''')
+                return cursor.fetchall()
+            except Exception as e:
+                print(f"Error fetching resume data: {str(e)}")
+                return []
 
     def render_resume_data_section(self):
         """Render resume data section with Excel download"""
@@ -475,141 +555,101 @@ class DashboardManager:
             st.info("No admin activity logs available")
 
     def export_to_excel(self):
-        """Export data to Excel format"""
-        query = """
-            SELECT 
-                rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
-                rd.summary, rd.target_role, rd.target_category,
-                rd.education, rd.experience, rd.projects, rd.skills,
-                ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
-                ra.missing_skills, ra.recommendations,
-                rd.created_at
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-        """
+        """Export data to Excel format as a streamed file handle"""
         try:
-            df = pd.read_sql_query(query, self.conn)
-            
-            # Create Excel writer object
-            output = BytesIO()
-            with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-                # Write main data
-                df.to_excel(writer, sheet_name='Resume Data', index=False)
-                
-                # Get the workbook and the worksheet
-                workbook = writer.book
-                worksheet = writer.sheets['Resume Data']
-                
-                # Add formatting
-                header_format = workbook.add_format({
-                    'bold': True,
-                    'text_wrap': True,
-                    'valign': 'top',
-                    'fg_color': '#D7E4BC',
-                    'border': 1
-                })
-                
-                # Write headers with formatting
-                for col_num, value in enumerate(df.columns.values):
-                    worksheet.write(0, col_num, value, header_format)
-                    
-                # Auto-adjust columns' width
-                for i, col in enumerate(df.columns):
-                    max_length = max(
-                        df[col].astype(str).apply(len).max(),
-                        len(str(col))
-                    ) + 2
-                    worksheet.set_column(i, i, min(max_length, 50))
-            
-            # Return the Excel file
-            output.seek(0)
-            return output.getvalue()
-            
+            return export_excel(RESUME_EXPORT_QUERY, sheet_name='Resume Data', header_format={
+                'bold': True,
+                'text_wrap': True,
+                'valign': 'top',
+                'fg_color': '#D7E4BC',
+                'border': 1
+            })
         except Exception as e:
             st.error(f"Error exporting to Excel: {str(e)}")
             return None
 
     def export_to_csv(self):
-        """Export data to CSV format"""
-        query = """
-            SELECT 
-                rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
-                rd.summary, rd.target_role, rd.target_category,
-                rd.education, rd.experience, rd.projects, rd.skills,
-                ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
-                ra.missing_skills, ra.recommendations,
-                rd.created_at
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-        """
+        """Export data to CSV format as a streamed file handle"""
         try:
-            df = pd.read_sql_query(query, self.conn)
-            return df.to_csv(index=False).encode('utf-8')
+            return export_csv(RESUME_EXPORT_QUERY)
         except Exception as e:
             st.error(f"Error exporting to CSV: {str(e)}")
             return None
 
     def export_to_json(self):
-        """Export data to JSON format"""
-        query = """
-            SELECT 
-                rd.*, ra.*
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-        """
+        """Export data to JSON format as a streamed file handle"""
         try:
-            df = pd.read_sql_query(query, self.conn)
-            return df.to_json(orient='records', date_format='iso')
+            return export_json(RESUME_JSON_EXPORT_QUERY)
         except Exception as e:
             st.error(f"Error exporting to JSON: {str(e)}")
             return None
 
+    def export_to_parquet(self):
+        """Export data to Parquet with typed columns as a streamed file handle"""
+        try:
+            return export_columnar('parquet')
+        except Exception as e:
+            st.error(f"Error exporting to Parquet: {str(e)}")
+            return None
+
+    def export_to_ndjson(self):
+        """Export data as newline-delimited JSON as a streamed file handle"""
+        try:
+            return export_ndjson(RESUME_JSON_EXPORT_QUERY)
+        except Exception as e:
+            st.error(f"Error exporting to NDJSON: {str(e)}")
+            return None
+
+    @cached_query
     def get_database_stats(self):
         """Get database statistics"""
-        cursor = self.conn.cursor()
-        stats = {}
+        with get_database_connection() as conn:
+            cursor = conn.cursor()
+            stats = {}
         
-        # Total resumes
-        cursor.execute("SELECT COUNT(*) FROM resume_data")
-        stats['total_resumes'] = cursor.fetchone()[0]
+            # Total resumes
+            cursor.execute("SELECT COUNT(*) FROM resume_data")
+            stats['total_resumes'] = cursor.fetchone()[0]
         
-        # Today's submissions
-        cursor.execute("""
-            SELECT COUNT(*) 
-            FROM resume_data 
-            WHERE DATE(created_at) = DATE('now')
-        """)
-        stats['today_submissions'] = cursor.fetchone()[0]
+            # Today's submissions
+            cursor.execute("""
+                SELECT COUNT(*) 
+                FROM resume_data 
+                WHERE DATE(created_at) = DATE('now')
+            """)
+            stats['today_submissions'] = cursor.fetchone()[0]
         
-        # Database size (approximate)
-        cursor.execute("PRAGMA page_count")
-        page_count = cursor.fetchone()[0]
-        cursor.execute("PRAGMA page_size")
-        page_size = cursor.fetchone()[0]
-        size_bytes = page_count * page_size
+            # Database size (approximate)
+            cursor.execute("PRAGMA page_count")
+            page_count = cursor.fetchone()[0]
+            cursor.execute("PRAGMA page_size")
+            page_size = cursor.fetchone()[0]
+            size_bytes = page_count * page_size
         
-        if size_bytes < 1024:
-            stats['storage_size'] = f"{size_bytes} bytes"
-        elif size_bytes < 1024 * 1024:
-            stats['storage_size'] = f"{size_bytes/1024:.1f} KB"
-        else:
-            stats['storage_size'] = f"{size_bytes/(1024*1024):.1f} MB"
+            if size_bytes < 1024:
+                stats['storage_size'] = f"{size_bytes} bytes"
+            elif size_bytes < 1024 * 1024:
+                stats['storage_size'] = f"{size_bytes/1024:.1f} KB"
+            else:
+                stats['storage_size'] = f"{size_bytes/(1024*1024):.1f} MB"
         
-        return stats
+            return stats
 
+    @cached_query
     def get_admin_logs(self):
         """Get admin logs"""
-        cursor = self.conn.cursor()
-        try:
-            cursor.execute('''
-            SELECT admin_email, action, timestamp
-            FROM admin_logs
-            ORDER BY timestamp DESC
-            ''')
-            return cursor.fetchall()
-        except Exception as e:
-            print(f"Error fetching admin logs: {str(e)}")
-            return []
+        with get_database_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute('''
+                SELECT admin_email, action, timestamp
+                FROM admin_logs
+                ORDER BY timestamp DESC
+                ''')
+                return cursor.fetchall()
+            except Exception as e:
+                print(f"Error fetching admin logs: {str(e)}")
+                return []
 
     def render_dashboard(self):
         """Main dashboard rendering function"""
@@ -842,160 +882,139 @@ class DashboardManager:
         if st.session_state.get('is_admin', False):
             self.render_admin_section()
 
+    @cached_query
     def get_trend_indicators(self):
         """Get trend indicators for stats"""
-        cursor = self.conn.cursor()
-        indicators = {}
+        with get_database_connection() as conn:
+            cursor = conn.cursor()
+            indicators = {}
         
-        # Compare with last week's data
-        for metric in ['resumes', 'ats', 'high_performing', 'success_rate']:
-            try:
-                if metric == 'resumes':
-                    cursor.execute("""
-                        SELECT 
-                            (COUNT(*) - (
-                                SELECT COUNT(*) 
-                                FROM resume_data 
-                                WHERE created_at < date('now', '-7 days')
-                            )) * 100.0 / 
-                            NULLIF((
-                                SELECT COUNT(*) 
-                                FROM resume_data 
-                                WHERE created_at < date('now', '-7 days')
-                            ), 0)
-                        FROM resume_data
-                    """)
-                elif metric == 'ats':
-                    cursor.execute("""
-                        SELECT 
-                            (AVG(ats_score) - (
-                                SELECT AVG(ats_score) 
-                                FROM resume_analysis 
-                                WHERE created_at < date('now', '-7 days')
-                            )) * 100.0 / 
-                            NULLIF((
-                                SELECT AVG(ats_score) 
-                                FROM resume_analysis 
-                                WHERE created_at < date('now', '-7 days')
-                            ), 0)
-                        FROM resume_analysis
-                    """)
+            # Compare with last week's data
+            for metric in ['resumes', 'ats', 'high_performing', 'success_rate']:
+                try:
+                    if metric == 'resumes':
+                        cursor.execute("""
+                            WITH totals AS (
+                                SELECT 
+                                    SUM(resume_count) as current,
+                                    SUM(CASE WHEN day < date('now', '-7 days') THEN resume_count ELSE 0 END) as previous
+                                FROM daily_resume_stats
+                            )
+                            SELECT (current - previous) * 100.0 / NULLIF(previous, 0)
+                            FROM totals
+                        """)
+                    elif metric == 'ats':
+                        cursor.execute("""
+                            WITH totals AS (
+                                SELECT 
+                                    SUM(ats_score_sum) / NULLIF(SUM(analysis_count), 0) as current,
+                                    SUM(CASE WHEN day < date('now', '-7 days') THEN ats_score_sum ELSE 0 END) /
+                                    NULLIF(SUM(CASE WHEN day < date('now', '-7 days') THEN analysis_count ELSE 0 END), 0) as previous
+                                FROM daily_resume_stats
+                            )
+                            SELECT (current - previous) * 100.0 / NULLIF(previous, 0)
+                            FROM totals
+                        """)
                 
-                change = cursor.fetchone()[0] or 0
-                indicators[metric] = {
-                    'value': abs(round(change, 1)),
-                    'icon': '↑' if change >= 0 else '↓',
-                    'class': 'trend-up' if change >= 0 else 'trend-down'
-                }
-            except Exception:
-                indicators[metric] = {
-                    'value': 0,
-                    'icon': '→',
-                    'class': 'trend-neutral'
-                }
+                    change = cursor.fetchone()[0] or 0
+                    indicators[metric] = {
+                        'value': abs(round(change, 1)),
+                        'icon': '↑' if change >= 0 else '↓',
+                        'class': 'trend-up' if change >= 0 else 'trend-down'
+                    }
+                except Exception:
+                    indicators[metric] = {
+                        'value': 0,
+                        'icon': '→',
+                        'class': 'trend-neutral'
+                    }
         
-        return indicators
+            return indicators
 
+    @cached_query
     def get_detailed_insights(self):
         """Get detailed insights from the database"""
-        cursor = self.conn.cursor()
-        insights = []
+        with get_database_connection() as conn:
+            cursor = conn.cursor()
+            insights = []
         
-        # Most Successful Job Category
-        cursor.execute("""
-            SELECT target_category, AVG(ats_score) as avg_score,
-                   COUNT(*) as submission_count
-            FROM resume_data rd
-            JOIN resume_analysis ra ON rd.id = ra.resume_id
-            GROUP BY target_category
-            ORDER BY avg_score DESC
-            LIMIT 1
-        """)
-        top_category = cursor.fetchone()
-        if top_category:
-            insights.append({
-                'title': 'Top Performing Category',
-                'icon': '🏆',
-                'description': f"{top_category[0]} leads with {top_category[1]:.1f}% average ATS score across {top_category[2]} submissions",
-                'trend_class': 'trend-up',
-                'trend_icon': '↑',
-                'trend_value': f"{top_category[1]:.1f}%"
-            })
+            # Most Successful Job Category
+            cursor.execute("""
+                SELECT target_category, AVG(ats_score) as avg_score,
+                       COUNT(*) as submission_count
+                FROM resume_data rd
+                JOIN resume_analysis ra ON rd.id = ra.resume_id
+                GROUP BY target_category
+                ORDER BY avg_score DESC
+                LIMIT 1
+            """)
+            top_category = cursor.fetchone()
+            if top_category:
+                insights.append({
+                    'title': 'Top Performing Category',
+                    'icon': '🏆',
+                    'description': f"{top_category[0]} leads with {top_category[1]:.1f}% average ATS score across {top_category[2]} submissions",
+                    'trend_class': 'trend-up',
+                    'trend_icon': '↑',
+                    'trend_value': f"{top_category[1]:.1f}%"
+                })
         
-        # Recent Improvement
-        cursor.execute("""
-            SELECT 
-                (SELECT AVG(ats_score) FROM resume_analysis 
-                 WHERE created_at >= date('now', '-7 days')) as recent_score,
-                (SELECT AVG(ats_score) FROM resume_analysis 
-                 WHERE created_at < date('now', '-7 days')) as old_score
-        """)
-        scores = cursor.fetchone()
-        if scores and scores[0] and scores[1]:
-            change = scores[0] - scores[1]
-            insights.append({
-                'title': 'Weekly Trend',
-                'icon': '📈',
-                'description': f"ATS scores have {'improved' if change >= 0 else 'decreased'} by {abs(change):.1f}% in the last week",
-                'trend_class': 'trend-up' if change >= 0 else 'trend-down',
-                'trend_icon': '↑' if change >= 0 else '↓',
-                'trend_value': f"{abs(change):.1f}%"
-            })
+            # Recent Improvement
+            cursor.execute("""
+                SELECT 
+                    (SELECT AVG(ats_score) FROM resume_analysis 
+                     WHERE created_at >= date('now', '-7 days')) as recent_score,
+                    (SELECT AVG(ats_score) FROM resume_analysis 
+                     WHERE created_at < date('now', '-7 days')) as old_score
+            """)
+            scores = cursor.fetchone()
+            if scores and scores[0] and scores[1]:
+                change = scores[0] - scores[1]
+                insights.append({
+                    'title': 'Weekly Trend',
+                    'icon': '📈',
+                    'description': f"ATS scores have {'improved' if change >= 0 else 'decreased'} by {abs(change):.1f}% in the last week",
+                    'trend_class': 'trend-up' if change >= 0 else 'trend-down',
+                    'trend_icon': '↑' if change >= 0 else '↓',
+                    'trend_value': f"{abs(change):.1f}%"
+                })
         
-        # Most Common Skills
-        cursor.execute("""
-            WITH RECURSIVE
-            split(skill, rest) AS (
-                SELECT '', skills || ',' 
-                FROM resume_data 
-                WHERE skills IS NOT NULL
-                UNION ALL
-                SELECT
-                    substr(rest, 0, instr(rest, ',')),
-                    substr(rest, instr(rest, ',') + 1)
-                FROM split 
-                WHERE rest <> ''
-            ),
-            cleaned_skills AS (
-                SELECT TRIM(REPLACE(REPLACE(skill, '[', ''), ']', '')) as skill
-                FROM split 
-                WHERE skill <> ''
-            )
-            SELECT skill, COUNT(*) as count
-            FROM cleaned_skills
-            GROUP BY skill
-            ORDER BY count DESC
-            LIMIT 3
-        """)
-        top_skills = cursor.fetchall()
-        if top_skills:
-            skills_text = f"Most in-demand skills: Python ({top_skills[0][1]} resumes), Java ({top_skills[1][1]} resumes), Express ({top_skills[2][1]} resumes)"
-            insights.append({
-                'title': 'Top Skills',
-                'icon': '💡',
-                'description': f"Most in-demand skills: {skills_text}",
-                'trend_class': 'trend-up',
-                'trend_icon': '🔝',
-                'trend_value': f"Top {len(top_skills)}"
-            })
+            # Most Common Skills
+            cursor.execute("""
+                SELECT s.display_name, sc.resume_count
+                FROM skill_counts sc
+                JOIN skills s ON s.id = sc.skill_id
+                ORDER BY sc.resume_count DESC
+                LIMIT 3
+            """)
+            top_skills = cursor.fetchall()
+            if top_skills:
+                skills_text = ', '.join(f"{skill} ({count} resumes)" for skill, count in top_skills)
+                insights.append({
+                    'title': 'Top Skills',
+                    'icon': '💡',
+                    'description': f"Most in-demand skills: {skills_text}",
+                    'trend_class': 'trend-up',
+                    'trend_icon': '🔝',
+                    'trend_value': f"Top {len(top_skills)}"
+                })
         
-        return insights
+            return insights
 
+    @cached_query
     def get_quick_stats(self):
         """Get quick statistics for the dashboard"""
-        cursor = self.conn.cursor()
-        
-        # Total Resumes
-        cursor.execute("SELECT COUNT(*) FROM resume_data")
-        total_resumes = cursor.fetchone()[0]
-        
-        # Average ATS Score
-        cursor.execute("SELECT AVG(ats_score) FROM resume_analysis")
-        avg_ats = cursor.fetchone()[0] or 0
-        
-        # High Performing Resumes
-        cursor.execute("SELECT COUNT(*) FROM resume_analysis WHERE ats_score >= 70")
-        high_performing = cursor.fetchone()[0]
+        with get_database_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT SUM(resume_count), SUM(ats_score_sum) / NULLIF(SUM(analysis_count), 0),
+                       SUM(high_scoring_count)
+                FROM daily_resume_stats
+            """)
+            total_resumes, avg_ats, high_performing = cursor.fetchone()
+            total_resumes = total_resumes or 0
+            avg_ats = avg_ats or 0
+            high_performing = high_performing or 0
         
         # Success Rate
         success_rate = (high_performing / total_resumes * 100) if total_resumes > 0 else 0
@@ -1103,27 +1122,27 @@ class DashboardManager:
         )
         return fig
 
-    def create_submission_trends_chart(self):
-        """Create a weekly submission trend chart"""
-        dates, submissions = self.get_weekly_trends()
+    def create_submission_trends_chart(self, bucket='day', periods=7):
+        """Create a submission trend chart over the last `periods` day/week/month buckets"""
+        series = self.get_bucketed_metrics(bucket, periods)
         fig = go.Figure()
         fig.add_trace(go.Scatter(
-            x=dates,
-            y=submissions,
+            x=series['labels'],
+            y=series['submissions'],
             mode='lines+markers',
             line=dict(color=self.colors['info'], width=3),
             marker=dict(size=8, color=self.colors['info'])
         ))
         
         fig.update_layout(
-            title="Weekly Submission Pattern",
+            title="Weekly Submission Pattern" if (bucket, periods) == ('day', 7) else f"Submissions per {bucket.title()}",
             paper_bgcolor=self.colors['card'],
             plot_bgcolor=self.colors['card'],
             font={'color': self.colors['text']},
             height=300,
             margin=dict(l=20, r=20, t=50, b=20)
         )
-        fig.update_xaxes(title_text="Day of Week", color=self.colors['text'])
+        fig.update_xaxes(title_text="Day of Week" if bucket == 'day' and periods <= 7 else bucket.title(), color=self.colors['text'])
         fig.update_yaxes(title_text="Number of Submissions", color=self.colors['text'])
         
         return fig
@@ -0,0 +1,87 @@
+import functools
+import threading
+import time
+
+from config.database import get_data_version
+
+_IMMUTABLE = (str, int, float, bool, bytes, type(None))
+
+# Seconds a cached result is served before it is recomputed, even without writes
+# (bounds staleness from other processes, e.g. the batch analyzer)
+DEFAULT_TTL = 60
+
+
+def _detach(value):
+    """Copy the mutable containers of a result; immutable rows (e.g. sqlite tuples) are shared"""
+    if isinstance(value, dict):
+        return {key: _detach(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_detach(item) for item in value]
+    if isinstance(value, tuple) and not all(isinstance(item, _IMMUTABLE) for item in value):
+        return tuple(_detach(item) for item in value)
+    return value
+
+
+class QueryCache:
+    """Process-wide cache of dashboard query results with TTL and data-version invalidation
+
+    Entries are keyed by query name and arguments and go stale as soon as
+    config.database.bump_data_version() records a write, so Streamlit reruns
+    reuse results only while the data is unchanged.
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL):
+        self.ttl = ttl
+        self._entries = {}  # key -> (data version, stored at, compute seconds, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.time_saved = 0.0
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for key, calling compute() on a miss or stale entry"""
+        version = get_data_version()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == version and now - entry[1] < self.ttl:
+                self.hits += 1
+                self.time_saved += entry[2]
+                # Hand out copies so callers cannot mutate the cached result
+                return _detach(entry[3])
+
+        started = time.perf_counter()
+        value = compute()
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (version, now, elapsed, value)
+        return _detach(value)
+
+    def stats(self):
+        """Hit/miss counters, hit rate and total query time saved in seconds"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'time_saved': self.time_saved,
+            'entries': len(self._entries)
+        }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by every DashboardManager, which is rebuilt on each Streamlit rerun
+query_cache = QueryCache()
+
+
+def cached_query(method):
+    """Serve a DashboardManager getter from query_cache, keyed by its name and arguments"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__qualname__, args, tuple(sorted(kwargs.items())))
+        return query_cache.get_or_compute(key, lambda: method(self, *args, **kwargs))
+    return wrapper
@@ -1,8 +1,8 @@
 import streamlit as st
-import sqlite3
 from datetime import datetime
 import pandas as pd
 import time
+from config.database import bump_data_version, get_database_connection
 
 class FeedbackManager:
     def __init__(self):
@@ -11,50 +11,44 @@ class FeedbackManager:
 
     def setup_database(self):
         """Create feedback table if it doesn't exist"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute('''
-            CREATE TABLE IF NOT EXISTS feedback (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                rating INTEGER,
-                usability_score INTEGER,
-                feature_satisfaction INTEGER,
-                missing_features TEXT,
-                improvement_suggestions TEXT,
-                user_experience TEXT,
-                timestamp DATETIME
-            )
-        ''')
-        conn.commit()
-        conn.close()
+        with get_database_connection(self.db_path) as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS feedback (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    rating INTEGER,
+                    usability_score INTEGER,
+                    feature_satisfaction INTEGER,
+                    missing_features TEXT,
+                    improvement_suggestions TEXT,
+                    user_experience TEXT,
+                    timestamp DATETIME
+                )
+            ''')
 
     def save_feedback(self, feedback_data):
         """Save feedback to database"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute('''
-            INSERT INTO feedback (
-                rating, usability_score, feature_satisfaction,
-                missing_features, improvement_suggestions,
-                user_experience, timestamp
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            feedback_data['rating'],
-            feedback_data['usability_score'],
-            feedback_data['feature_satisfaction'],
-            feedback_data['missing_features'],
-            feedback_data['improvement_suggestions'],
-            feedback_data['user_experience'],
-            datetime.now()
-        ))
-        conn.commit()
-        conn.close()
+        with get_database_connection(self.db_path) as conn:
+            conn.execute('''
+                INSERT INTO feedback (
+                    rating, usability_score, feature_satisfaction,
+                    missing_features, improvement_suggestions,
+                    user_experience, timestamp
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                feedback_data['rating'],
+                feedback_data['usability_score'],
+                feedback_data['feature_satisfaction'],
+                feedback_data['missing_features'],
+                feedback_data['improvement_suggestions'],
+                feedback_data['user_experience'],
+                datetime.now()
+            ))
+        bump_data_version()
 
     def get_feedback_stats(self):
         """Get feedback statistics"""
-        conn = sqlite3.connect(self.db_path)
-        df = pd.read_sql_query("SELECT * FROM feedback", conn)
-        conn.close()
+        with get_database_connection(self.db_path) as conn:
+            df = pd.read_sql_query("SELECT * FROM feedback", conn)
         
         if df.empty:
             return {
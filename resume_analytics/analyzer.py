@@ -1,15 +1,35 @@
-import spacy
 from collections import Counter
 from datetime import datetime
 
+from resume_analytics.nlp_models import DEFAULT_MODEL, get_nlp
+from resume_analytics.skill_matcher import get_skill_matcher
+
 class ResumeAnalyzer:
-    def __init__(self):
-        self.nlp = spacy.load("en_core_web_sm")
+    def __init__(self, model=DEFAULT_MODEL):
+        # DEFAULT_MODEL is the model-free lite pipeline; pass FULL_MODEL for spaCy's statistical one
+        self.model = model
+        
+    @property
+    def nlp(self):
+        # Shared across instances and loaded on first use (see nlp_models)
+        return get_nlp(self.model)
         
     def analyze_resume(self, resume_text):
         """Analyze resume text and return metrics"""
-        doc = self.nlp(resume_text)
+        return self._analyze_doc(resume_text, self.nlp(resume_text))
+    
+    def analyze_many(self, texts, batch_size=64, n_process=1):
+        """Analyze many resume texts with nlp.pipe, returning results in input order
         
+        n_process > 1 fans the batches out to worker processes, which pays off
+        for large corpora only (each worker loads its own copy of the model).
+        """
+        texts = list(texts)
+        docs = self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        return [self._analyze_doc(text, doc) for text, doc in zip(texts, docs)]
+    
+    def _analyze_doc(self, resume_text, doc):
+        """Metrics and suggestions for one processed resume"""
         # Basic metrics
         word_count = len(resume_text.split())
         sentence_count = len(list(doc.sents))
@@ -42,24 +62,8 @@ class ResumeAnalyzer:
     
     def _extract_skills(self, doc):
         """Extract skills from resume"""
-        # Common technical skills keywords
-        tech_skills = {
-            "python", "java", "javascript", "react", "node.js", "sql",
-            "html", "css", "aws", "docker", "kubernetes", "git",
-            "machine learning", "ai", "data science", "analytics"
-        }
-        
-        skills = set()
-        for token in doc:
-            if token.text.lower() in tech_skills:
-                skills.add(token.text)
-            # Check for compound skills (e.g., "machine learning")
-            if token.i < len(doc) - 1:
-                bigram = (token.text + " " + doc[token.i + 1].text).lower()
-                if bigram in tech_skills:
-                    skills.add(bigram)
-        
-        return skills
+        # JOB_ROLES vocabulary including multi-word skills; acronyms match by exact case
+        return get_skill_matcher(self.model)(doc)
     
     def _analyze_experience(self, doc):
         """Analyze years of experience"""
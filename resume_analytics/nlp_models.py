@@ -0,0 +1,78 @@
+"""
+Process-wide registry of spaCy pipelines, loaded on first use
+
+Resume analytics only needs tokens, lexical attributes (like_num) and
+sentence boundaries. By default it runs the "lite" pipeline: a blank
+English tokenizer with the rule-based sentencizer, which needs no model
+download. The statistical model is used only when asked for by name; the
+tagger, parser, NER and lemmatizer are then excluded at load time and
+sentences come from its senter (or a sentencizer when it has none).
+
+Objects built from a pipeline, such as the skill PhraseMatcher, are kept
+alongside it with get_resource, so each is built once per process and
+dropped together with its pipeline by clear_models.
+"""
+import threading
+
+FULL_MODEL = "en_core_web_sm"
+# "blank:<lang>" names a model-free tokenizer + sentencizer pipeline
+LITE_MODEL = "blank:en"
+DEFAULT_MODEL = LITE_MODEL
+
+# Components resume analytics never reads
+UNUSED_COMPONENTS = ("tagger", "parser", "ner", "lemmatizer", "attribute_ruler", "morphologizer")
+
+_models = {}
+_resources = {}
+_lock = threading.Lock()
+
+
+def _load(name, exclude):
+    import spacy
+
+    if name.startswith("blank:"):
+        nlp = spacy.blank(name.split(":", 1)[1])
+        nlp.add_pipe("sentencizer")
+        return nlp
+
+    nlp = spacy.load(name, exclude=list(exclude))
+    if "senter" in nlp.disabled:
+        nlp.enable_pipe("senter")
+    if not nlp.has_pipe("senter") and not nlp.has_pipe("parser"):
+        nlp.add_pipe("sentencizer")
+    # A shared tok2vec is dead weight once the components listening to it are excluded
+    if nlp.has_pipe("tok2vec") and not getattr(nlp.get_pipe("tok2vec"), "listening_components", True):
+        nlp.remove_pipe("tok2vec")
+    return nlp
+
+
+def get_nlp(name=DEFAULT_MODEL, exclude=UNUSED_COMPONENTS):
+    """Return the shared pipeline for name, loading it once per process"""
+    key = (name, tuple(exclude))
+    nlp = _models.get(key)
+    if nlp is None:
+        with _lock:
+            nlp = _models.get(key)
+            if nlp is None:
+                nlp = _models[key] = _load(name, exclude)
+    return nlp
+
+
+def get_resource(name, key, build, exclude=UNUSED_COMPONENTS):
+    """Return build(nlp) for the shared pipeline of name, building it once per process"""
+    resource_key = (name, tuple(exclude), key)
+    resource = _resources.get(resource_key)
+    if resource is None:
+        nlp = get_nlp(name, exclude)
+        with _lock:
+            resource = _resources.get(resource_key)
+            if resource is None:
+                resource = _resources[resource_key] = build(nlp)
+    return resource
+
+
+def clear_models():
+    """Drop every loaded pipeline and the resources built from them (the next get_nlp reloads)"""
+    with _lock:
+        _models.clear()
+        _resources.clear()
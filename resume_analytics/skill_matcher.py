@@ -0,0 +1,133 @@
+"""
+Skill detection with a spaCy PhraseMatcher over the JOB_ROLES skill vocabulary
+
+Patterns match on the LOWER attribute, so "machine learning", "Machine
+Learning" and "MACHINE LEARNING" all hit, and multi-token skills such as
+"React Native" or "Unreal Engine" are found in one linear pass. Short or
+all-caps entries ("R", "UI", "SQL") match case-sensitively instead, so
+ordinary words like "r" or "ui" in prose are not read as skills, and a
+one-letter skill only counts next to list punctuation or a line break.
+
+The built matcher is shared through the nlp_models registry, so it is
+built once per process. Only the tokenized patterns are cached on disk (as
+a DocBin keyed by model and vocabulary): a later process skips tokenizing
+them but still adds them to a new PhraseMatcher.
+"""
+import hashlib
+import os
+
+from config.job_roles import JOB_ROLES
+from resume_analytics.nlp_models import get_resource
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+
+# Generic terms detected before the vocabulary came from JOB_ROLES
+BASE_SKILLS = (
+    "Python", "Java", "JavaScript", "React", "Node.js", "SQL",
+    "HTML", "CSS", "AWS", "Docker", "Kubernetes", "Git",
+    "Machine Learning", "AI", "Data Science", "Analytics"
+)
+
+# Tokens next to a one-letter skill ("R", "C") that show it sits in a list
+_LIST_PUNCTUATION = {',', '/', '|', '(', ')', ';', ':', '.', '•', '-', '&'}
+
+
+def _is_acronym(name):
+    """Skills that only count when written in their own casing"""
+    return len(name) <= 2 or name.isupper()
+
+
+def _in_list_context(span):
+    """True if a one-letter match is next to list punctuation or a line break
+
+    "R, SQL" or a line holding just "R" count; "R is a letter." does not.
+    """
+    doc = span.doc
+    if span.end == len(doc):
+        return True
+    neighbours = [doc[span.end]] + ([doc[span.start - 1]] if span.start > 0 else [])
+    return any(token.text in _LIST_PUNCTUATION or '\n' in token.text for token in neighbours)
+
+
+def skill_vocabulary():
+    """Every required/recommended skill in JOB_ROLES, deduplicated case-insensitively
+
+    Slash-separated alternatives ("Python/Java/Node.js") are also added part
+    by part. Returns display names sorted by their lowercase form.
+    """
+    names = list(BASE_SKILLS)
+    for roles in JOB_ROLES.values():
+        for role in roles.values():
+            names.extend(role.get('required_skills', []))
+            recommended = role.get('recommended_skills', {})
+            groups = recommended.values() if isinstance(recommended, dict) else [recommended]
+            for group in groups:
+                names.extend(group)
+
+    vocabulary = {}
+    for name in names:
+        parts = [name] + (name.split('/') if '/' in name else [])
+        for part in parts:
+            part = ' '.join(part.split())
+            if part and part.lower() not in vocabulary:
+                vocabulary[part.lower()] = part
+    return [vocabulary[key] for key in sorted(vocabulary)]
+
+
+class SkillMatcher:
+    """PhraseMatchers returning the display names of the skills found in a Doc
+
+    Acronyms go to a case-sensitive ORTH matcher, everything else to a
+    case-insensitive LOWER one.
+    """
+
+    def __init__(self, nlp, model_name, vocabulary=None, cache_dir=CACHE_DIR):
+        from spacy.matcher import PhraseMatcher
+
+        self.vocabulary = vocabulary or skill_vocabulary()
+        self.matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+        self.acronym_matcher = PhraseMatcher(nlp.vocab, attr="ORTH")
+        for name, pattern in zip(self.vocabulary, self._patterns(nlp, model_name, cache_dir)):
+            matcher = self.acronym_matcher if _is_acronym(name) else self.matcher
+            matcher.add(name, [pattern])
+            if len(name) == 1:
+                # The tokenizer keeps "R." as one token when a sentence ends on the skill
+                matcher.add(name, [nlp.make_doc(name + '.')])
+
+    def _patterns(self, nlp, model_name, cache_dir):
+        from spacy.tokens import DocBin
+
+        digest = hashlib.sha1('\n'.join([model_name] + self.vocabulary).encode('utf-8')).hexdigest()[:16]
+        path = os.path.join(cache_dir, f"skill_patterns-{digest}.spacy")
+        if os.path.exists(path):
+            try:
+                docs = list(DocBin().from_disk(path).get_docs(nlp.vocab))
+                if len(docs) == len(self.vocabulary):
+                    return docs
+            except Exception as e:
+                print(f"Error loading cached skill patterns: {str(e)}")
+
+        docs = list(nlp.tokenizer.pipe(self.vocabulary))
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            DocBin(attrs=["ORTH"], docs=docs).to_disk(temp_path)
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"Error caching skill patterns: {str(e)}")
+        return docs
+
+    def __call__(self, doc):
+        """Skills in doc; overlapping hits keep the longest span ("React Native" over "React")"""
+        from spacy.util import filter_spans
+
+        spans = self.matcher(doc, as_spans=True) + [
+            span for span in self.acronym_matcher(doc, as_spans=True)
+            if len(span.text) > 1 or _in_list_context(span)
+        ]
+        return {span.label_ for span in filter_spans(spans)}
+
+
+def get_skill_matcher(model_name):
+    """Return the SkillMatcher for a model's shared pipeline, building it once per process"""
+    return get_resource(model_name, 'skill_matcher', lambda nlp: SkillMatcher(nlp, model_name))
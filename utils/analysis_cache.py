@@ -0,0 +1,67 @@
+import hashlib
+import json
+import time
+
+from config.database import get_database_connection
+from utils.resume_analyzer import ANALYZER_VERSION, SCORING_WEIGHTS
+
+
+def scoring_fingerprint():
+    """Fingerprint of everything that changes analysis output besides the input itself"""
+    return json.dumps({'version': ANALYZER_VERSION, 'weights': SCORING_WEIGHTS}, sort_keys=True)
+
+
+class AnalysisCache:
+    """Persistent, size-bounded LRU cache of resume analyses keyed by file content and role"""
+
+    def __init__(self, max_entries=1000):
+        self.max_entries = max_entries
+
+    def make_key(self, file_bytes, job_requirements):
+        """Hash the uploaded bytes together with the role requirements and scoring weights"""
+        digest = hashlib.sha256()
+        digest.update(scoring_fingerprint().encode('utf-8'))
+        digest.update(json.dumps(job_requirements, sort_keys=True).encode('utf-8'))
+        digest.update(file_bytes)
+        return digest.hexdigest()
+
+    def get(self, cache_key):
+        """Return (analysis, resume_id) for a cached entry, or None on a miss"""
+        try:
+            with get_database_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT analysis, resume_id FROM analysis_cache WHERE cache_key = ?', (cache_key,))
+                row = cursor.fetchone()
+                if not row:
+                    return None
+                cursor.execute('UPDATE analysis_cache SET last_accessed = ? WHERE cache_key = ?',
+                               (time.time(), cache_key))
+                return json.loads(row[0]), row[1]
+        except Exception as e:
+            print(f"Error reading analysis cache: {str(e)}")
+            return None
+
+    def put(self, cache_key, analysis, resume_id=None):
+        """Store an analysis and evict the least recently used entries beyond max_entries"""
+        try:
+            with get_database_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                INSERT OR REPLACE INTO analysis_cache (cache_key, analysis, resume_id, last_accessed)
+                VALUES (?, ?, ?, ?)
+                ''', (cache_key, json.dumps(analysis), resume_id, time.time()))
+                cursor.execute('''
+                DELETE FROM analysis_cache
+                WHERE cache_key NOT IN (
+                    SELECT cache_key FROM analysis_cache
+                    ORDER BY last_accessed DESC
+                    LIMIT ?
+                )
+                ''', (self.max_entries,))
+        except Exception as e:
+            print(f"Error writing analysis cache: {str(e)}")
+
+    def clear(self):
+        """Drop every cached analysis"""
+        with get_database_connection() as conn:
+            conn.execute('DELETE FROM analysis_cache')
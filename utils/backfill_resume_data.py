@@ -0,0 +1,26 @@
+"""
+One-off job converting resumes saved before JSON storage and filling resume_skills
+
+Usage:
+    python -m utils.backfill_resume_data [--batch-size 500]
+"""
+import argparse
+import time
+
+from config.database import backfill_resume_data, init_database
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rewrite legacy resume columns as JSON and index their skills")
+    parser.add_argument('--batch-size', type=int, default=500, help="Rows converted per transaction")
+    args = parser.parse_args(argv)
+
+    init_database()
+    started = time.perf_counter()
+    converted, skilled = backfill_resume_data(batch_size=args.batch_size)
+    elapsed = time.perf_counter() - started
+    print(f"Converted {converted} rows to JSON and indexed skills for {skilled} resumes in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+Headless batch scoring for large resume drops (directories or archives)
+
+Usage:
+    python -m utils.batch_analyzer resumes.zip --category "Data Science and Analytics" --role "Data Scientist"
+"""
+import argparse
+import json
+import os
+import tarfile
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from config.database import ResumeWriteBuffer, init_database
+from config.job_roles import JOB_ROLES
+from utils.document_ingestion import load_document
+from utils.resume_analyzer import ResumeAnalyzer
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx')
+
+# Analyzer owned by each worker process, created by _init_worker
+_worker_analyzer = None
+
+
+def _is_supported(name):
+    return name.lower().endswith(SUPPORTED_EXTENSIONS) and not os.path.basename(name).startswith('.')
+
+
+def iter_resume_sources(path):
+    """Yield (name, source) tasks for every resume in a directory, zip or tar archive
+
+    Plain files are passed by path as ('file', path). Archive members are read
+    in order from one open archive and passed as ('bytes', data), so a
+    compressed tar is decompressed once instead of rescanned per member.
+    The caller pulls tasks only as worker slots free up, which bounds how
+    many members are held in memory.
+    """
+    if os.path.isdir(path):
+        for root, _, files in os.walk(path):
+            for file_name in sorted(files):
+                if _is_supported(file_name):
+                    file_path = os.path.join(root, file_name)
+                    yield file_path, ('file', file_path)
+    elif zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and _is_supported(info.filename):
+                    yield info.filename, ('bytes', archive.read(info))
+    elif tarfile.is_tarfile(path):
+        # Stream mode reads members strictly front to back without seeking
+        with tarfile.open(path, mode='r|*') as archive:
+            for member in archive:
+                if member.isfile() and _is_supported(member.name):
+                    yield member.name, ('bytes', archive.extractfile(member).read())
+    else:
+        raise ValueError(f"Expected a directory, zip or tar archive: {path}")
+
+
+def build_resume_record(analysis, target_role, target_category):
+    """Map an analyze_resume result onto the resume_data/resume_analysis rows"""
+    resume_data = {
+        'personal_info': {
+            'full_name': analysis.get('name', ''),
+            'email': analysis.get('email', ''),
+            'phone': analysis.get('phone', ''),
+            'linkedin': analysis.get('linkedin', ''),
+            'github': analysis.get('github', ''),
+            'portfolio': analysis.get('portfolio', '')
+        },
+        'summary': analysis.get('summary', ''),
+        'target_role': target_role,
+        'target_category': target_category,
+        'education': analysis.get('education', []),
+        'experience': analysis.get('experience', []),
+        'projects': analysis.get('projects', []),
+        'skills': analysis.get('skills', []),
+        'template': ''
+    }
+    analysis_data = {
+        'ats_score': analysis['ats_score'],
+        'keyword_match_score': analysis['keyword_match']['score'],
+        'format_score': analysis['format_score'],
+        'section_score': analysis['section_score'],
+        'missing_skills': ','.join(analysis['keyword_match']['missing_skills']),
+        'recommendations': ','.join(analysis['suggestions'])
+    }
+    return resume_data, analysis_data
+
+
+def _init_worker():
+    global _worker_analyzer
+    _worker_analyzer = ResumeAnalyzer()
+
+
+def _score_task(task):
+    """Extract and score one resume inside a worker process"""
+    name, source, job_requirements, target_role, target_category = task
+    try:
+        # Plain files are opened (and memory-mapped for PDFs) by path; archive members arrive as bytes
+        file = source[1]
+        options = {'workers': 1} if name.lower().endswith('.pdf') else {}
+        # Already inside a pool worker, so PDF pages are extracted in-process
+        document = load_document(file, name=name, **options)
+        analysis = _worker_analyzer.analyze_resume({'raw_text': document.text}, job_requirements)
+    except Exception as e:
+        return {'name': name, 'status': 'error', 'error': str(e)}
+
+    if analysis.get('document_type') != 'resume':
+        return {'name': name, 'status': 'skipped', 'document_type': analysis.get('document_type')}
+
+    # Only the database rows travel back to the parent, never the raw text
+    resume_data, analysis_data = build_resume_record(analysis, target_role, target_category)
+    return {
+        'name': name,
+        'status': 'scored',
+        'ats_score': analysis['ats_score'],
+        'resume_data': resume_data,
+        'analysis_data': analysis_data
+    }
+
+
+def score_resumes(path, target_category, target_role, workers=None, batch_size=200, save=True,
+                  flush_interval=5.0):
+    """Score every resume under path across a process pool, yielding one result per file
+
+    At most two tasks per worker are in flight at a time and scored rows go
+    through a ResumeWriteBuffer, which writes them batch_size at a time (or
+    after flush_interval seconds), so memory stays bounded regardless of how
+    many resumes the archive holds.
+    """
+    job_requirements = JOB_ROLES[target_category][target_role]
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * 2
+    write_buffer = ResumeWriteBuffer(batch_size=batch_size, flush_interval=flush_interval)
+
+    if save:
+        init_database()
+
+    sources = iter_resume_sources(path)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        pending = set()
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < max_pending:
+                try:
+                    name, source = next(sources)
+                except StopIteration:
+                    exhausted = True
+                    break
+                task = (name, source, job_requirements, target_role, target_category)
+                pending.add(executor.submit(_score_task, task))
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if save and result['status'] == 'scored':
+                    write_buffer.add(result['resume_data'], result['analysis_data'])
+                yield result
+
+    if save:
+        write_buffer.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a directory or archive of resumes against a job role")
+    parser.add_argument('path', help="Directory, .zip or .tar archive containing PDF/DOCX resumes")
+    parser.add_argument('--category', required=True, choices=list(JOB_ROLES.keys()), help="Job category from JOB_ROLES")
+    parser.add_argument('--role', required=True, help="Role within the job category")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (defaults to CPU count)")
+    parser.add_argument('--batch-size', type=int, default=200, help="Rows written per database transaction")
+    parser.add_argument('--flush-interval', type=float, default=5.0,
+                        help="Seconds after which a partial batch is written")
+    parser.add_argument('--output', help="Write one JSON result per line to this file")
+    parser.add_argument('--no-save', action='store_true', help="Score only, skip the database")
+    args = parser.parse_args(argv)
+
+    if args.role not in JOB_ROLES[args.category]:
+        parser.error(f"Unknown role '{args.role}' for category '{args.category}'")
+
+    counts = {'scored': 0, 'skipped': 0, 'error': 0}
+    started = time.perf_counter()
+    output = open(args.output, 'w', encoding='utf-8') if args.output else None
+    try:
+        for result in score_resumes(args.path, args.category, args.role, workers=args.workers,
+                                    batch_size=args.batch_size, save=not args.no_save,
+                                    flush_interval=args.flush_interval):
+            counts[result['status']] += 1
+            if result['status'] == 'error':
+                print(f"Error processing {result['name']}: {result['error']}")
+            if output:
+                summary = {key: value for key, value in result.items() if key not in ('resume_data', 'analysis_data')}
+                output.write(json.dumps(summary) + '\n')
+    finally:
+        if output:
+            output.close()
+
+    elapsed = time.perf_counter() - started
+    total = sum(counts.values())
+    print(f"Processed {total} files in {elapsed:.1f}s "
+          f"({counts['scored']} scored, {counts['skipped']} skipped, {counts['error']} errors)")
+
+
+if __name__ == "__main__":
+    main()
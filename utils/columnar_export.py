@@ -0,0 +1,266 @@
+"""
+Columnar (Parquet / Arrow IPC) exports of resumes and their analyses for analytics
+
+Columns carry real types instead of the text SQLite stores: skills,
+missing skills and recommendations become list<string>, scores float64 and
+timestamps timestamp[s]. Rows are converted and written one record batch
+per fetchmany chunk.
+
+Snapshots are incremental: write_snapshot() keeps two watermarks (the
+highest exported resume id and analysis id) in a manifest next to the
+files. Each run writes the resumes added since the previous one, plus any
+analysis committed since then for a resume that was already exported (the
+app saves the analysis in its own transaction after the resume). Rows are
+keyed by (resume_id, analysis_id), so such a resume appears once without
+and once with its analysis.
+
+Usage:
+    python -m utils.columnar_export OUTPUT_DIR [--format parquet|arrow] [--full]
+"""
+import argparse
+import itertools
+import json
+import os
+import tempfile
+from datetime import datetime
+
+from config.database import iter_skills, parse_stored_value
+from utils.streaming_export import CHUNK_SIZE, rewind_tempfile, stream_query
+
+FORMATS = ('parquet', 'arrow')
+MANIFEST_NAME = '_watermark.json'
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+_EXPORT_COLUMNS = """
+        rd.id AS resume_id, rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
+        rd.summary, rd.target_role, rd.target_category, rd.template,
+        rd.education, rd.experience, rd.projects, rd.skills,
+        rd.created_at,
+        ra.id AS analysis_id, ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
+        ra.missing_skills, ra.recommendations,
+        ra.created_at AS analyzed_at
+"""
+
+# Resumes after the resume watermark, then analyses after the analysis watermark
+# on resumes already exported; both halves are primary key range scans (CROSS JOIN
+# and the unary + keep SQLite from driving the second half off another index)
+COLUMNAR_EXPORT_QUERY = f"""
+    SELECT {_EXPORT_COLUMNS}
+    FROM resume_data rd
+    LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
+    WHERE rd.id > ?
+    UNION ALL
+    SELECT {_EXPORT_COLUMNS}
+    FROM resume_analysis ra
+    CROSS JOIN resume_data rd ON rd.id = ra.resume_id
+    WHERE ra.id > ? AND +ra.resume_id <= ?
+    ORDER BY resume_id, analysis_id
+"""
+
+_STRING_COLUMNS = ('name', 'email', 'phone', 'linkedin', 'github', 'portfolio', 'summary',
+                   'target_role', 'target_category', 'template', 'education', 'experience', 'projects')
+_SCORE_COLUMNS = ('ats_score', 'keyword_match_score', 'format_score', 'section_score')
+_LIST_COLUMNS = ('skills', 'missing_skills', 'recommendations')
+_TIMESTAMP_COLUMNS = ('created_at', 'analyzed_at')
+
+
+def arrow_schema():
+    """Arrow schema of COLUMNAR_EXPORT_QUERY; education/experience/projects stay JSON text"""
+    import pyarrow as pa
+
+    fields = [pa.field('resume_id', pa.int64(), nullable=False)]
+    fields += [pa.field(name, pa.string()) for name in _STRING_COLUMNS]
+    fields += [
+        pa.field('skills', pa.list_(pa.string())),
+        pa.field('skill_categories', pa.list_(pa.string())),
+        pa.field('created_at', pa.timestamp('s')),
+        pa.field('analysis_id', pa.int64())
+    ]
+    fields += [pa.field(name, pa.float64()) for name in _SCORE_COLUMNS]
+    fields += [
+        pa.field('missing_skills', pa.list_(pa.string())),
+        pa.field('recommendations', pa.list_(pa.string())),
+        pa.field('analyzed_at', pa.timestamp('s'))
+    ]
+    return pa.schema(fields)
+
+
+def _split_list(text):
+    # missing_skills / recommendations are stored comma-joined
+    if not text:
+        return []
+    return [part.strip() for part in text.split(',') if part.strip()]
+
+
+def _parse_timestamp(text):
+    if not text:
+        return None
+    try:
+        return datetime.strptime(text[:19], TIMESTAMP_FORMAT)
+    except ValueError:
+        return None
+
+
+def _record_batch(columns, rows, schema):
+    """Convert one chunk of query rows into a typed RecordBatch"""
+    import pyarrow as pa
+
+    data = {name: [] for name in schema.names}
+    for row in rows:
+        record = dict(zip(columns, row))
+        skills = list(iter_skills(parse_stored_value(record['skills'])))
+        data['resume_id'].append(record['resume_id'])
+        for name in _STRING_COLUMNS:
+            data[name].append(record[name])
+        data['skills'].append([skill for skill, _ in skills])
+        data['skill_categories'].append([str(category) for _, category in skills])
+        data['analysis_id'].append(record['analysis_id'])
+        for name in _SCORE_COLUMNS:
+            value = record[name]
+            data[name].append(float(value) if value is not None else None)
+        for name in ('missing_skills', 'recommendations'):
+            data[name].append(_split_list(record[name]))
+        for name in _TIMESTAMP_COLUMNS:
+            data[name].append(_parse_timestamp(record[name]))
+    return pa.RecordBatch.from_pydict(data, schema=schema)
+
+
+class _Writer:
+    """Parquet or Arrow IPC file writer with a common write_batch/close interface"""
+
+    def __init__(self, sink, schema, file_format):
+        if file_format not in FORMATS:
+            raise ValueError(f"Unknown columnar format: {file_format}")
+        if file_format == 'parquet':
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(sink, schema, compression='zstd')
+        else:
+            import pyarrow as pa
+            self._writer = pa.ipc.new_file(sink, schema)
+
+    def write_batch(self, batch):
+        self._writer.write_batch(batch)
+
+    def close(self):
+        self._writer.close()
+
+
+def write_columnar(sink, file_format='parquet', since_id=0, since_analysis_id=0, chunk_size=CHUNK_SIZE):
+    """Write resumes with id > since_id, and analyses with id > since_analysis_id
+    of older resumes, to sink (a path or binary file)
+
+    Returns (rows written, highest resume id, highest analysis id); each
+    watermark is returned unchanged when nothing newer was written.
+    """
+    schema = arrow_schema()
+    rows = stream_query(COLUMNAR_EXPORT_QUERY, (since_id, since_analysis_id, since_id), chunk_size)
+    columns = next(rows)
+    analysis_index = columns.index('analysis_id')
+    writer = _Writer(sink, schema, file_format)
+    written = 0
+    last_id = since_id
+    last_analysis_id = since_analysis_id
+    try:
+        while True:
+            chunk = list(itertools.islice(rows, chunk_size))
+            if not chunk:
+                break
+            writer.write_batch(_record_batch(columns, chunk, schema))
+            written += len(chunk)
+            for row in chunk:
+                last_id = max(last_id, row[0])
+                if row[analysis_index] is not None:
+                    last_analysis_id = max(last_analysis_id, row[analysis_index])
+    finally:
+        writer.close()
+    return written, last_id, last_analysis_id
+
+
+def export_columnar(file_format='parquet', chunk_size=CHUNK_SIZE):
+    """Export everything to a temporary file and return it as a read-only handle for download"""
+    handle = tempfile.TemporaryFile()
+    write_columnar(handle, file_format, chunk_size=chunk_size)
+    return rewind_tempfile(handle)
+
+
+def read_manifest(output_dir):
+    """Load the snapshot manifest of output_dir, or an empty one"""
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {'last_resume_id': 0, 'last_analysis_id': 0, 'snapshots': []}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_manifest(output_dir, manifest):
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(temp_path, path)
+
+
+def write_snapshot(output_dir, file_format='parquet', full=False, chunk_size=CHUNK_SIZE):
+    """Write the resumes and analyses added since the last snapshot in output_dir
+
+    Files are numbered in sequence; the manifest records the id ranges each
+    one covers. full=True ignores the watermarks and exports everything
+    again. Returns the new file's path, or None when there was nothing new.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = read_manifest(output_dir)
+    since_id = 0 if full else manifest['last_resume_id']
+    since_analysis_id = 0 if full else manifest.get('last_analysis_id', 0)
+
+    extension = 'parquet' if file_format == 'parquet' else 'arrow'
+    temp_path = os.path.join(output_dir, f".snapshot_in_progress.{extension}")
+    try:
+        written, last_id, last_analysis_id = write_columnar(
+            temp_path, file_format, since_id, since_analysis_id, chunk_size
+        )
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    if not written:
+        os.remove(temp_path)
+        return None
+
+    file_name = f"resumes_{len(manifest['snapshots']) + 1:06d}.{extension}"
+    path = os.path.join(output_dir, file_name)
+    os.replace(temp_path, path)
+
+    manifest['last_resume_id'] = max(manifest['last_resume_id'], last_id)
+    manifest['last_analysis_id'] = max(manifest.get('last_analysis_id', 0), last_analysis_id)
+    manifest['snapshots'].append({
+        'file': file_name,
+        'rows': written,
+        'first_resume_id': since_id + 1,
+        'last_resume_id': last_id,
+        'last_analysis_id': last_analysis_id,
+        'created_at': datetime.now().strftime(TIMESTAMP_FORMAT)
+    })
+    _write_manifest(output_dir, manifest)
+    return path
+
+
+def main(argv=None):
+    from config.database import init_database
+
+    parser = argparse.ArgumentParser(description="Write an incremental columnar snapshot of resume data")
+    parser.add_argument('output_dir', help="Directory holding the snapshot files and watermark")
+    parser.add_argument('--format', choices=FORMATS, default='parquet', help="Parquet or Arrow IPC file")
+    parser.add_argument('--full', action='store_true', help="Ignore the watermark and export every row")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="Rows per record batch")
+    args = parser.parse_args(argv)
+
+    init_database()
+    path = write_snapshot(args.output_dir, args.format, args.full, args.chunk_size)
+    if path:
+        print(f"Wrote {path}")
+    else:
+        print("No new resumes since the last snapshot")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,12 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime
+from sqlalchemy import create_engine, event, Column, ForeignKey, Integer, String, Text, DateTime
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import joinedload, relationship, scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool
+from contextlib import contextmanager
 import datetime
 
+from config.database import BUSY_TIMEOUT, CONNECTION_PRAGMAS
+
 # Create the base class for declarative models
 Base = declarative_base()
 
@@ -11,58 +15,127 @@ class Resume(Base):
     __tablename__ = 'resumes'
     
     id = Column(Integer, primary_key=True)
-    user_id = Column(String(100))
+    user_id = Column(String(100), index=True)
     job_role = Column(String(100))
     content = Column(Text)
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+    
+    analyses = relationship('Analysis', back_populates='resume', order_by='Analysis.id')
 
 # Define the Analysis model
 class Analysis(Base):
     __tablename__ = 'analyses'
     
     id = Column(Integer, primary_key=True)
-    resume_id = Column(Integer)
+    resume_id = Column(Integer, ForeignKey('resumes.id'), index=True)
     analysis_data = Column(Text)  # Store JSON data
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    
+    resume = relationship('Resume', back_populates='analyses')
+
+def _apply_pragmas(dbapi_connection, connection_record):
+    # Same WAL/cache settings as the sqlite3 pool in config/database.py
+    for pragma in CONNECTION_PRAGMAS:
+        dbapi_connection.execute(pragma)
 
 class DatabaseManager:
-    def __init__(self, db_path='resume_data.db'):
-        self.engine = create_engine(f'sqlite:///{db_path}')
+    def __init__(self, db_path='resume_data.db', pool_size=5, max_overflow=10):
+        self.engine = create_engine(
+            f'sqlite:///{db_path}',
+            poolclass=QueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=True,
+            connect_args={'check_same_thread': False, 'timeout': BUSY_TIMEOUT}
+        )
+        event.listen(self.engine, 'connect', _apply_pragmas)
         Base.metadata.create_all(self.engine)
-        Session = sessionmaker(bind=self.engine)
-        self.session = Session()
+        # create_all skips indexes on tables that already exist
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+        # One session per thread; objects keep their loaded attributes after commit
+        self.Session = scoped_session(sessionmaker(bind=self.engine, expire_on_commit=False))
+    
+    @contextmanager
+    def _session_scope(self, commit=False):
+        """Thread-scoped session that is removed on exit
+        
+        Removing it returns the pooled connection and drops the identity map,
+        so every call reads fresh rows; returned objects come back detached.
+        """
+        session = self.Session()
+        try:
+            yield session
+            if commit:
+                session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            self.Session.remove()
     
     def save_resume(self, user_id, job_role, content):
-        resume = Resume(
-            user_id=user_id,
-            job_role=job_role,
-            content=content
-        )
-        self.session.add(resume)
-        self.session.commit()
+        with self._session_scope(commit=True) as session:
+            resume = Resume(
+                user_id=user_id,
+                job_role=job_role,
+                content=content
+            )
+            session.add(resume)
         return resume.id
     
+    def save_resumes(self, resumes):
+        """Insert many resumes (dicts with user_id, job_role, content) in one transaction and return their ids"""
+        mappings = [dict(resume) for resume in resumes]
+        with self._session_scope(commit=True) as session:
+            session.bulk_insert_mappings(Resume, mappings, return_defaults=True)
+        return [mapping['id'] for mapping in mappings]
+    
     def get_resume(self, resume_id):
-        return self.session.query(Resume).filter(Resume.id == resume_id).first()
+        # Analyses are loaded up front because the resume is detached once the session is removed
+        with self._session_scope() as session:
+            return (
+                session.query(Resume)
+                .options(joinedload(Resume.analyses))
+                .filter(Resume.id == resume_id)
+                .first()
+            )
     
     def get_user_resumes(self, user_id):
-        return self.session.query(Resume).filter(Resume.user_id == user_id).all()
+        """Resumes of a user with their analyses loaded in the same query"""
+        with self._session_scope() as session:
+            return (
+                session.query(Resume)
+                .options(joinedload(Resume.analyses))
+                .filter(Resume.user_id == user_id)
+                .order_by(Resume.id)
+                .all()
+            )
     
     def save_analysis(self, resume_id, analysis_data):
-        analysis = Analysis(
-            resume_id=resume_id,
-            analysis_data=analysis_data
-        )
-        self.session.add(analysis)
-        self.session.commit()
+        with self._session_scope(commit=True) as session:
+            analysis = Analysis(
+                resume_id=resume_id,
+                analysis_data=analysis_data
+            )
+            session.add(analysis)
         return analysis.id
     
+    def save_analyses(self, analyses):
+        """Insert many analyses (dicts with resume_id, analysis_data) in one transaction"""
+        with self._session_scope(commit=True) as session:
+            session.bulk_insert_mappings(Analysis, [dict(analysis) for analysis in analyses])
+    
     def get_analysis(self, analysis_id):
-        return self.session.query(Analysis).filter(Analysis.id == analysis_id).first()
+        with self._session_scope() as session:
+            return session.query(Analysis).filter(Analysis.id == analysis_id).first()
     
     def get_resume_analyses(self, resume_id):
-        return self.session.query(Analysis).filter(Analysis.resume_id == resume_id).all()
+        with self._session_scope() as session:
+            return session.query(Analysis).filter(Analysis.resume_id == resume_id).all()
     
     def close(self):
-        self.session.close()
+        self.Session.remove()
+        self.engine.dispose()
@@ -0,0 +1,159 @@
+"""
+Single entry point for reading uploaded resumes (PDF, DOCX, plain text)
+
+Every analyzer consumes the Document returned by load_document, so each
+upload is read and decoded exactly once.
+"""
+import io
+import os
+
+PDF_MEDIA_TYPE = 'application/pdf'
+DOCX_MEDIA_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+TEXT_MEDIA_TYPE = 'text/plain'
+
+# Registered backends, keyed by file extension and by media type
+_BACKENDS_BY_EXTENSION = {}
+_BACKENDS_BY_MEDIA_TYPE = {}
+
+
+class Document:
+    """Decoded text of an upload plus its structure
+
+    pages and paragraphs are (start, end) character offsets into the decoded
+    text, i.e. text[start:end], not byte offsets into the file. A PDF or text
+    paragraph is one non-empty line; a DOCX paragraph is one paragraph or
+    table row. tables holds each DOCX table as a list of rows of cell text.
+    """
+
+    def __init__(self, name, media_type, text, pages=None, paragraphs=None, tables=None):
+        self.name = name
+        self.media_type = media_type
+        self.text = text
+        self.pages = pages or []
+        self.paragraphs = paragraphs or []
+        self.tables = tables or []
+
+    def iter_pages(self):
+        for start, end in self.pages:
+            yield self.text[start:end]
+
+    def iter_paragraphs(self):
+        for start, end in self.paragraphs:
+            yield self.text[start:end]
+
+    def __len__(self):
+        return len(self.text)
+
+
+def register_backend(media_type, *extensions):
+    """Register loader(stream, **options) -> (text, pages, paragraphs, tables) for a media type"""
+    def decorator(loader):
+        _BACKENDS_BY_MEDIA_TYPE[media_type] = (media_type, loader)
+        for extension in extensions:
+            _BACKENDS_BY_EXTENSION[extension.lower()] = (media_type, loader)
+        return loader
+    return decorator
+
+
+def _join(segments, separator):
+    """Join segments once and return the text with the (start, end) span of each segment"""
+    spans = []
+    position = 0
+    for segment in segments:
+        spans.append((position, position + len(segment)))
+        position += len(segment) + len(separator)
+    return separator.join(segments), spans
+
+
+def _line_spans(text, offset=0):
+    """Spans of the non-empty lines of text, shifted by offset"""
+    spans = []
+    position = 0
+    for line in text.split('\n'):
+        if line.strip():
+            spans.append((offset + position, offset + position + len(line)))
+        position += len(line) + 1
+    return spans
+
+
+def open_buffer(file):
+    """Return a seekable binary stream over file without copying its contents
+
+    Paths are opened, file objects (including Streamlit uploads) are rewound
+    and used in place, and bytes-like objects are wrapped.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        return open(file, 'rb')
+    if isinstance(file, (bytes, bytearray, memoryview)):
+        return io.BytesIO(file)
+    file.seek(0)
+    return file
+
+
+@register_backend(PDF_MEDIA_TYPE, '.pdf')
+def _load_pdf(stream, **options):
+    from utils.pdf_extractor import iter_pdf_pages
+
+    pages = list(iter_pdf_pages(stream, **options))
+    # Every page keeps its trailing newline, matching the original extractor
+    text, page_spans = _join(pages + [''], '\n')
+    page_spans = page_spans[:-1]
+    paragraphs = []
+    for (start, _), page in zip(page_spans, pages):
+        paragraphs.extend(_line_spans(page, start))
+    return text, page_spans, paragraphs, []
+
+
+@register_backend(DOCX_MEDIA_TYPE, '.docx')
+def _load_docx(stream, **options):
+    from utils.docx_extractor import iter_docx_blocks, table_row_text
+
+    # Paragraphs and table rows become lines in the order they appear
+    lines = []
+    tables = []
+    for kind, value in iter_docx_blocks(stream):
+        if kind == 'table':
+            tables.append(value)
+            lines.extend(table_row_text(row) for row in value)
+        else:
+            lines.append(value)
+    text, paragraphs = _join(lines, '\n')
+    return text, [(0, len(text))], paragraphs, tables
+
+
+@register_backend(TEXT_MEDIA_TYPE, '.txt')
+def _load_text(stream, encoding='utf-8', **options):
+    data = stream.getbuffer() if isinstance(stream, io.BytesIO) else stream.read()
+    text = str(data, encoding, errors='replace')
+    return text, [(0, len(text))], _line_spans(text), []
+
+
+def _resolve_backend(name, media_type):
+    if media_type in _BACKENDS_BY_MEDIA_TYPE:
+        return _BACKENDS_BY_MEDIA_TYPE[media_type]
+    extension = os.path.splitext(name or '')[1].lower()
+    if extension in _BACKENDS_BY_EXTENSION:
+        return _BACKENDS_BY_EXTENSION[extension]
+    raise ValueError(f"Unsupported document type: {media_type or extension or name}")
+
+
+def load_document(file, name=None, media_type=None, **options):
+    """Read and decode an upload, path or bytes into a Document
+
+    The backend is chosen from media_type (or the upload's .type), falling
+    back to the file extension. Extra options go to the backend, e.g.
+    workers/max_pages for PDFs.
+    """
+    if name is None:
+        name = os.fspath(file) if isinstance(file, (str, os.PathLike)) else getattr(file, 'name', None)
+    if media_type is None:
+        media_type = getattr(file, 'type', None)
+    media_type, loader = _resolve_backend(name, media_type)
+
+    stream = open_buffer(file)
+    try:
+        text, pages, paragraphs, tables = loader(stream, **options)
+    finally:
+        if stream is not file:
+            stream.close()
+    return Document(name, media_type, text, pages, paragraphs, tables)
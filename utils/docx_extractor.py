@@ -0,0 +1,121 @@
+import re
+import zipfile
+from xml.etree.ElementTree import iterparse
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+MC = '{http://schemas.openxmlformats.org/markup-compatibility/2006}'
+
+BODY_PART = 'word/document.xml'
+HEADER_PART = re.compile(r'word/header\d*\.xml$')
+FOOTER_PART = re.compile(r'word/footer\d*\.xml$')
+
+# Run children that python-docx also renders as text
+_RUN_CHARACTERS = {
+    W + 'tab': '\t',
+    W + 'br': '\n',
+    W + 'cr': '\n',
+    W + 'noBreakHyphen': '-'
+}
+
+
+def _iter_part_blocks(part):
+    """Yield ('paragraph', text) and ('table', rows) from one XML part in document order
+
+    Text boxes are reached through their w:txbxContent paragraphs; the
+    legacy mc:Fallback copy of each text box is skipped so it is not read twice.
+    """
+    paragraphs = []   # Text fragments of each open paragraph (text boxes nest them)
+    tables = []       # Open tables: {'rows': [...], 'row': [...], 'cell': [...]}
+    run_depth = 0
+    fallback_depth = 0
+
+    for event, elem in iterparse(part, events=('start', 'end')):
+        tag = elem.tag
+        if event == 'start':
+            if tag == MC + 'Fallback':
+                fallback_depth += 1
+            elif fallback_depth:
+                continue
+            elif tag == W + 'p':
+                paragraphs.append([])
+            elif tag == W + 'r':
+                run_depth += 1
+            elif tag == W + 'tbl':
+                tables.append({'rows': [], 'row': None, 'cell': None})
+            elif tag == W + 'tr' and tables:
+                tables[-1]['row'] = []
+            elif tag == W + 'tc' and tables:
+                tables[-1]['cell'] = []
+            continue
+
+        if fallback_depth and tag != MC + 'Fallback':
+            continue
+
+        if tag == W + 't':
+            if paragraphs and run_depth:
+                paragraphs[-1].append(elem.text or '')
+        elif tag in _RUN_CHARACTERS:
+            if paragraphs and run_depth:
+                paragraphs[-1].append(_RUN_CHARACTERS[tag])
+        elif tag == W + 'r':
+            run_depth -= 1
+        elif tag == W + 'p':
+            text = ''.join(paragraphs.pop())
+            if tables and tables[-1]['cell'] is not None:
+                tables[-1]['cell'].append(text)
+            else:
+                yield 'paragraph', text
+            elem.clear()
+        elif tag == W + 'tc' and tables:
+            table = tables[-1]
+            if table['row'] is not None:
+                table['row'].append('\n'.join(table['cell']))
+            table['cell'] = None
+        elif tag == W + 'tr' and tables:
+            table = tables[-1]
+            table['rows'].append(table['row'])
+            table['row'] = None
+        elif tag == W + 'tbl' and tables:
+            rows = tables.pop()['rows']
+            if tables and tables[-1]['cell'] is not None:
+                # Nested table: flatten its rows into the enclosing cell
+                tables[-1]['cell'].extend(table_row_text(row) for row in rows)
+            else:
+                yield 'table', rows
+            elem.clear()
+        elif tag == MC + 'Fallback':
+            fallback_depth -= 1
+
+
+def iter_docx_blocks(stream):
+    """Yield ('paragraph', text) and ('table', rows) blocks from a DOCX file
+
+    The body comes first, then headers, then footers, so the first line is
+    still the body's (extract_personal_info reads the name from it). Each
+    part is decompressed and parsed incrementally straight from the zip
+    archive, without building a python-docx object model. Header and footer
+    parts repeated for first/even pages are only emitted once.
+    """
+    with zipfile.ZipFile(stream) as archive:
+        names = archive.namelist()
+        headers = sorted(name for name in names if HEADER_PART.match(name))
+        footers = sorted(name for name in names if FOOTER_PART.match(name))
+
+        for part_names, repeated in (([BODY_PART], False), (headers, True), (footers, True)):
+            seen = set()
+            for part_name in part_names:
+                with archive.open(part_name) as part:
+                    if not repeated:
+                        yield from _iter_part_blocks(part)
+                        continue
+                    # Header/footer parts are tiny, so compare them whole
+                    blocks = list(_iter_part_blocks(part))
+                    key = repr(blocks)
+                    if any(value for _, value in blocks) and key not in seen:
+                        seen.add(key)
+                        yield from blocks
+
+
+def table_row_text(row):
+    """Render a table row as one line, keeping cells apart with the skills separator"""
+    return ' | '.join(cell.replace('\n', ' ') for cell in row)
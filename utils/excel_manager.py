@@ -1,43 +1,124 @@
+import json
+import os
+import shutil
+import threading
 import pandas as pd
 from datetime import datetime
+from config.database import get_database_connection, init_database
+from utils.streaming_export import export_excel
+
+EXCEL_COLUMNS = ['user_id', 'job_role', 'content', 'analysis_data', 'created_at']
+EXCEL_LOG_QUERY = f"SELECT {', '.join(EXCEL_COLUMNS)} FROM excel_resume_log ORDER BY id"
+
+# New log rows after which a save rewrites the workbook
+COMPACT_EVERY = 500
+
+# Compactions run one at a time so an older snapshot never replaces a newer one
+_compact_lock = threading.Lock()
 
 class ExcelManager:
-    def __init__(self):
-        self.excel_file = "resume_data.xlsx"
-    
-    def save_resume_data(self, user_id, job_role, content, analysis_data=None):
+    """Resume rows kept in the append-only excel_resume_log table
+
+    Saves are single INSERTs, so they stay O(1) and concurrent writers do not
+    overwrite each other. The log is the store of record; compact()
+    materializes resume_data.xlsx from it, on demand or automatically once
+    compact_every rows have been logged since the last compaction
+    (None disables the automatic step).
+    """
+
+    def __init__(self, excel_file="resume_data.xlsx", compact_every=COMPACT_EVERY):
+        self.excel_file = excel_file
+        self.compact_every = compact_every
+        init_database()
+        self._import_existing_workbook()
+
+    def _import_existing_workbook(self):
+        """Seed an empty log with the rows of a workbook written by the old read-modify-write code"""
+        if not os.path.exists(self.excel_file):
+            return
         try:
-            # Try to read existing Excel file
-            try:
+            with get_database_connection() as conn:
+                if conn.execute('SELECT 1 FROM excel_resume_log LIMIT 1').fetchone():
+                    return
                 df = pd.read_excel(self.excel_file)
-            except FileNotFoundError:
-                df = pd.DataFrame()
-            
-            # Create new data entry
-            new_data = {
-                'user_id': user_id,
-                'job_role': job_role,
-                'content': content,
-                'analysis_data': str(analysis_data) if analysis_data else None,
-                'created_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            
-            # Append new data
-            df = pd.concat([df, pd.DataFrame([new_data])], ignore_index=True)
-            
-            # Save to Excel
-            df.to_excel(self.excel_file, index=False)
-            return True
+                rows = [
+                    tuple(None if pd.isna(row.get(column)) else str(row.get(column)) for column in EXCEL_COLUMNS)
+                    for row in df.to_dict('records')
+                ]
+                conn.executemany(
+                    'INSERT INTO excel_resume_log (user_id, job_role, content, analysis_data, created_at) VALUES (?, ?, ?, ?, ?)',
+                    rows
+                )
+        except Exception as e:
+            print(f"Error importing existing Excel file: {str(e)}")
+
+    def save_resume_data(self, user_id, job_role, content, analysis_data=None):
+        try:
+            with get_database_connection() as conn:
+                cursor = conn.execute('''
+                INSERT INTO excel_resume_log (user_id, job_role, content, analysis_data, created_at)
+                VALUES (?, ?, ?, ?, ?)
+                ''', (
+                    user_id,
+                    job_role,
+                    content,
+                    json.dumps(analysis_data, default=str) if analysis_data else None,
+                    datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                ))
+                log_id = cursor.lastrowid
         except Exception as e:
-            print(f"Error saving to Excel: {str(e)}")
+            print(f"Error saving to Excel log: {str(e)}")
             return False
-    
+
+        if self.compact_every and log_id - self._compacted_through() >= self.compact_every:
+            self.compact()
+        return True
+
+    def _compacted_through(self):
+        """Highest log id already written to this workbook (0 if never compacted)"""
+        with get_database_connection() as conn:
+            row = conn.execute(
+                'SELECT last_log_id FROM excel_compactions WHERE excel_file = ?', (self.excel_file,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def compact(self):
+        """Write every logged row to the Excel file, replacing it atomically
+
+        The workbook is streamed from the log in constant memory and moved
+        into place only when complete. Returns True on success.
+        """
+        temp_path = f"{self.excel_file}.{os.getpid()}.tmp"
+        with _compact_lock:
+            try:
+                with get_database_connection() as conn:
+                    last_log_id = conn.execute('SELECT COALESCE(MAX(id), 0) FROM excel_resume_log').fetchone()[0]
+                query = f"SELECT {', '.join(EXCEL_COLUMNS)} FROM excel_resume_log WHERE id <= ? ORDER BY id"
+                with export_excel(query, (last_log_id,), sheet_name='Resumes') as workbook, open(temp_path, 'wb') as f:
+                    shutil.copyfileobj(workbook, f)
+                os.replace(temp_path, self.excel_file)
+                with get_database_connection() as conn:
+                    conn.execute('''
+                    INSERT INTO excel_compactions (excel_file, last_log_id, compacted_at) VALUES (?, ?, ?)
+                    ON CONFLICT (excel_file) DO UPDATE SET
+                        last_log_id = MAX(last_log_id, excluded.last_log_id),
+                        compacted_at = excluded.compacted_at
+                    ''', (self.excel_file, last_log_id, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+                return True
+            except Exception as e:
+                print(f"Error compacting Excel file: {str(e)}")
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                return False
+
     def get_all_resumes(self):
-        try:
-            return pd.read_excel(self.excel_file)
-        except FileNotFoundError:
-            return pd.DataFrame()
-    
+        with get_database_connection() as conn:
+            return pd.read_sql_query(EXCEL_LOG_QUERY, conn)
+
     def get_user_resumes(self, user_id):
-        df = self.get_all_resumes()
-        return df[df['user_id'] == user_id]
+        # Served by idx_excel_resume_log_user_id instead of filtering a full load
+        with get_database_connection() as conn:
+            return pd.read_sql_query(
+                f"SELECT {', '.join(EXCEL_COLUMNS)} FROM excel_resume_log WHERE user_id = ? ORDER BY id",
+                conn, params=(user_id,)
+            )
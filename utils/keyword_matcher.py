@@ -0,0 +1,101 @@
+from collections import deque
+from functools import lru_cache
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton that finds every keyword in a single pass over the text"""
+
+    def __init__(self, keywords):
+        # Trie transitions, failure links and output lists, indexed by state
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+        # Resolved transitions (goto plus failure links), filled in lazily
+        self._delta = None
+        self.keywords = set()
+
+        for keyword in keywords:
+            keyword = keyword.lower()
+            if keyword and keyword not in self.keywords:
+                self.keywords.add(keyword)
+                self._add(keyword)
+        self._build_failure_links()
+
+    def _add(self, keyword):
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+                self._goto[state][char] = next_state
+            state = next_state
+        self._out[state] = (keyword,)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                # Inherit the keywords that end at the fallback state
+                self._out[next_state] += self._out[self._fail[next_state]]
+        self._delta = [dict(transitions) for transitions in self._goto]
+
+    def _step(self, state, char):
+        """Resolve and memoize the transition for a character not seen in this state"""
+        goto, fail = self._goto, self._fail
+        current = state
+        while current and char not in goto[current]:
+            current = fail[current]
+        next_state = goto[current].get(char, 0)
+        self._delta[state][char] = next_state
+        return next_state
+
+    def find_all(self, text):
+        """Return (start, end, keyword) for every keyword occurrence in lower-cased text"""
+        delta, out, step = self._delta, self._out, self._step
+        hits = []
+        state = 0
+        for index, char in enumerate(text):
+            next_state = delta[state].get(char)
+            state = step(state, char) if next_state is None else next_state
+            for keyword in out[state]:
+                hits.append((index - len(keyword) + 1, index + 1, keyword))
+        return hits
+
+    def matches(self, text):
+        """Return the set of distinct keywords found in lower-cased text"""
+        return set().union(*self.matches_by_line(text))
+
+    def matches_by_line(self, text):
+        """Return one set of found keywords per newline-separated line of lower-cased text"""
+        delta, out, step = self._delta, self._out, self._step
+        lines = []
+        found = set()
+        state = 0
+        for char in text:
+            if char == '\n':
+                # No keyword spans a line break, so restart from the root
+                lines.append(found)
+                found = set()
+                state = 0
+                continue
+            next_state = delta[state].get(char)
+            state = step(state, char) if next_state is None else next_state
+            if out[state]:
+                found.update(out[state])
+        lines.append(found)
+        return lines
+
+
+@lru_cache(maxsize=8)
+def get_keyword_matcher(keywords):
+    """Return a shared matcher for a frozenset of keywords, compiling it only once"""
+    return KeywordMatcher(keywords)
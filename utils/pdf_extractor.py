@@ -0,0 +1,132 @@
+import atexit
+import io
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import PyPDF2
+
+# Larger uploads, or documents with more pages, are rejected outright with a
+# ValueError rather than truncated; a small file can still hold many pages
+MAX_PDF_BYTES = 20 * 1024 * 1024
+MAX_PDF_PAGES = 50
+# Documents with more pages than this are split across worker processes
+PARALLEL_PAGE_THRESHOLD = 8
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    """Return the process pool shared by every call and thread, started only once
+
+    It is sized to the CPU count; callers limit their parallelism by how many
+    page ranges they submit, so the pool is never resized or shut down early.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+                atexit.register(_executor.shutdown, wait=False)
+    return _executor
+
+
+def _stream_size(stream):
+    position = stream.tell()
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(position)
+    return size
+
+
+def _extract_page_range(path, start, stop):
+    """Extract pages [start, stop) from a PDF on disk inside a worker process"""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        reader = PyPDF2.PdfReader(data)
+        return [reader.pages[index].extract_text() or '' for index in range(start, stop)]
+
+
+def _file_path(file):
+    """Return the on-disk path backing a file object, if it has one
+
+    A file object counts only when its descriptor is the file its name
+    points at; uploads and BytesIO have a name but no usable fileno().
+    """
+    if isinstance(file, (str, os.PathLike)):
+        return os.fspath(file)
+    name = getattr(file, 'name', None)
+    if not isinstance(name, str):
+        return None
+    try:
+        if os.path.samestat(os.fstat(file.fileno()), os.stat(name)):
+            return name
+    except (AttributeError, io.UnsupportedOperation, OSError, ValueError):
+        pass
+    return None
+
+
+def iter_pdf_pages(file, max_pages=MAX_PDF_PAGES, max_bytes=MAX_PDF_BYTES, workers=None):
+    """Yield the text of each PDF page in order
+
+    Accepts a path or a binary file object. Files on disk are memory-mapped
+    rather than copied; small documents are read in-process and larger
+    ones are split into at most `workers` page ranges extracted by a shared
+    process pool. Documents over max_bytes or max_pages raise ValueError
+    before any page is extracted; pass max_pages=None for no page cap.
+    """
+    path = _file_path(file)
+    owns_file = path is not None and isinstance(file, (str, os.PathLike))
+    stream = open(path, 'rb') if owns_file else file
+    spooled_path = None
+
+    try:
+        if path is None:
+            stream.seek(0)
+        size = os.path.getsize(path) if path else _stream_size(stream)
+        if size > max_bytes:
+            raise ValueError(f"PDF is {size / (1024 * 1024):.1f} MB, the limit is {max_bytes / (1024 * 1024):.0f} MB")
+
+        data = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) if path else stream
+        try:
+            reader = PyPDF2.PdfReader(data)
+            page_count = len(reader.pages)
+            if max_pages is not None and page_count > max_pages:
+                raise ValueError(f"PDF has {page_count} pages, the limit is {max_pages}")
+            workers = min(workers or os.cpu_count() or 1, page_count)
+
+            if workers <= 1 or page_count <= PARALLEL_PAGE_THRESHOLD:
+                for index in range(page_count):
+                    yield reader.pages[index].extract_text() or ''
+                return
+        finally:
+            if path:
+                data.close()
+
+        if path is None:
+            # Workers need a file to map; spool the in-memory upload to disk once
+            stream.seek(0)
+            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as target:
+                shutil.copyfileobj(stream, target)
+                spooled_path = target.name
+            path = spooled_path
+
+        chunk = -(-page_count // workers)
+        ranges = [(start, min(start + chunk, page_count)) for start in range(0, page_count, chunk)]
+        executor = _get_executor()
+        futures = [executor.submit(_extract_page_range, path, start, stop) for start, stop in ranges]
+        for future in futures:
+            yield from future.result()
+    finally:
+        if owns_file:
+            stream.close()
+        if spooled_path:
+            os.unlink(spooled_path)
+
+
+def extract_pdf_text(file, max_pages=MAX_PDF_PAGES, max_bytes=MAX_PDF_BYTES, workers=None):
+    """Return the text of a PDF with one trailing newline per page, joined once"""
+    return ''.join(f"{page}\n" for page in iter_pdf_pages(file, max_pages, max_bytes, workers))
@@ -1,4 +1,48 @@
 import re
+from functools import lru_cache
+import numpy as np
+from config.job_roles import JOB_ROLES
+from utils.keyword_matcher import get_keyword_matcher
+
+# Weight of each section score in the overall ATS score. Cached analyses
+# are keyed on these, so changing a weight invalidates them.
+SCORING_WEIGHTS = {
+    'contact': 0.1,      # 10% weight for contact info
+    'summary': 0.1,      # 10% weight for summary
+    'skills': 0.3,       # 30% weight for skills match
+    'experience': 0.2,   # 20% weight for experience
+    'education': 0.1,    # 10% weight for education
+    'format': 0.2        # 20% weight for formatting
+}
+
+# Compiled once at import; every pattern the analyzer runs lives here
+EMAIL_PATTERN = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+PHONE_PATTERN = re.compile(r'(\+\d{1,3}[-.]?)?\s*\(?\d{3}\)?[-.]?\s*\d{3}[-.]?\s*\d{4}')
+LINKEDIN_PATTERN = re.compile(r'linkedin\.com/in/[\w-]+')
+GITHUB_PATTERN = re.compile(r'github\.com/[\w-]+')
+# Any well-formed contact detail: email, phone or LinkedIn
+CONTACT_PATTERN = re.compile(
+    r'\b[\w\.-]+@[\w\.-]+\.\w+\b'
+    r'|\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'
+    r'|linkedin\.com/\w+'
+)
+CONTACT_WORDS_PATTERN = re.compile(r'\b(?:email|phone|address|tel|mobile|linkedin)\b')
+# Features of a lower-cased experience entry, found in one scan. The
+# alternatives match disjoint characters, so none can hide another.
+EXPERIENCE_FEATURES_PATTERN = re.compile(
+    r'(?P<date>\b(?:19|20)\d{2}\b)'
+    r'|(?P<bullet>[•\-\*])'
+    r'|(?P<action_verb>\b(?:developed|managed|created|implemented|designed|led|improved)\b)'
+)
+# Features of a lower-cased education entry, found in one scan
+EDUCATION_FEATURES_PATTERN = re.compile(
+    r'(?P<date>\b(?:19|20)\d{2}\b)'
+    r'|(?P<degree>\b(?:bachelor|master|phd|b\.|m\.|diploma)\b)'
+    r'|(?P<gpa>\b(?:gpa|cgpa|grade|percentage)\b)'
+)
+
+# Bump when analysis logic changes in a way that should invalidate cached results
+ANALYZER_VERSION = 2
 
 class ResumeAnalyzer:
     def __init__(self):
@@ -21,14 +65,95 @@ class ResumeAnalyzer:
                 'date of issue', 'identification'
             ]
         }
+
+        # Section header keywords, consumed together by segment_sections
+        self.section_keywords = {
+            'education': [
+                'education', 'academic', 'qualification', 'degree', 'university', 'college',
+                'school', 'institute', 'certification', 'diploma', 'bachelor', 'master',
+                'phd', 'b.tech', 'm.tech', 'b.e', 'm.e', 'b.sc', 'm.sc','bca', 'mca', 'b.com',
+                'm.com', 'b.cs-it', 'imca', 'bba', 'mba', 'honors', 'scholarship'
+            ],
+            'experience': [
+                'experience', 'employment', 'work history', 'professional experience',
+                'work experience', 'career history', 'professional background',
+                'employment history', 'job history', 'positions held', 'experience',
+                'job title', 'job responsibilities', 'job description', 'job summary'
+            ],
+            'projects': [
+                'projects', 'personal projects', 'academic projects', 'key projects',
+                'major projects', 'professional projects', 'project experience',
+                'relevant projects', 'featured projects','latest projects',
+                'top projects'
+            ],
+            'skills': [
+                'skills', 'technical skills', 'competencies', 'expertise',
+                'core competencies', 'professional skills', 'key skills',
+                'technical expertise', 'proficiencies', 'qualifications',
+                'top skills', 'key skill', 'major skill', 'personal skill',
+                'soft skills', 'soft skill', 'soft skillset'
+            ],
+            'summary': [
+                'summary', 'professional summary', 'career summary', 'objective',
+                'career objective', 'professional objective', 'about me', 'profile',
+                'professional profile', 'career profile', 'overview', 'skill summary'
+            ]
+        }
+
+        # Keywords that mark the essential sections checked by check_resume_sections
+        self.essential_sections = {
+            'contact': ['email', 'phone', 'address', 'linkedin'],
+            'education': ['education', 'university', 'college', 'degree', 'academic'],
+            'experience': ['experience', 'work', 'employment', 'job', 'internship'],
+            'skills': ['skills', 'technologies', 'tools', 'proficiencies', 'expertise']
+        }
+
+        # One automaton over every skill and keyword table, shared across instances
+        self.keyword_matcher = get_keyword_matcher(frozenset(self._keyword_vocabulary()))
+
+        # Last text and results produced by segment_sections and _line_hits
+        self._segment_cache = None
+        self._hits_cache = None
+
+    def _keyword_vocabulary(self):
+        """Collect job role skills and keyword tables for the shared matcher"""
+        vocabulary = set()
+        for roles in JOB_ROLES.values():
+            for role_info in roles.values():
+                vocabulary.update(role_info.get('required_skills', []))
+                for skills in role_info.get('recommended_skills', {}).values():
+                    vocabulary.update(skills)
+        for table in (self.document_types, self.section_keywords, self.essential_sections):
+            for keywords in table.values():
+                vocabulary.update(keywords)
+        return {keyword.lower() for keyword in vocabulary}
+
+    def _line_hits(self, text):
+        """Return the vocabulary keywords found on each line, scanning the text once"""
+        if self._hits_cache is None or self._hits_cache[0] != text:
+            line_hits = self.keyword_matcher.matches_by_line(text.lower())
+            self._hits_cache = (text, line_hits, set().union(*line_hits))
+        return self._hits_cache[1]
+
+    def _keyword_hits(self, text):
+        """Return the set of vocabulary keywords found anywhere in the text"""
+        self._line_hits(text)
+        return self._hits_cache[2]
+
+    def _contains(self, keyword, text_lower, hits):
+        """Check a keyword against the matcher hits, scanning only for unknown keywords"""
+        if keyword in self.keyword_matcher.keywords:
+            return keyword in hits
+        return keyword in text_lower
         
     def detect_document_type(self, text):
+        hits = self._keyword_hits(text)
         text = text.lower()
         scores = {}
         
         # Calculate score for each document type
         for doc_type, keywords in self.document_types.items():
-            matches = sum(1 for keyword in keywords if keyword in text)
+            matches = sum(1 for keyword in keywords if self._contains(keyword, text, hits))
             density = matches / len(keywords)
             frequency = matches / (len(text.split()) + 1)  # Add 1 to avoid division by zero
             scores[doc_type] = (density * 0.7) + (frequency * 0.3)
@@ -40,17 +165,14 @@ class ResumeAnalyzer:
         return best_match[0] if best_match[1] > 0.15 else 'unknown'
         
     def calculate_keyword_match(self, resume_text, required_skills):
+        hits = self._keyword_hits(resume_text)
         resume_text = resume_text.lower()
         found_skills = []
         missing_skills = []
         
         for skill in required_skills:
-            skill_lower = skill.lower()
-            # Check for exact match
-            if skill_lower in resume_text:
-                found_skills.append(skill)
-            # Check for partial matches (e.g., "Python" in "Python programming")
-            elif any(skill_lower in phrase for phrase in resume_text.split('.')):
+            # Substring match also covers partial phrases (e.g., "Python" in "Python programming")
+            if self._contains(skill.lower(), resume_text, hits):
                 found_skills.append(skill)
             else:
                 missing_skills.append(skill)
@@ -64,17 +186,12 @@ class ResumeAnalyzer:
         }
         
     def check_resume_sections(self, text):
+        hits = self._keyword_hits(text)
         text = text.lower()
-        essential_sections = {
-            'contact': ['email', 'phone', 'address', 'linkedin'],
-            'education': ['education', 'university', 'college', 'degree', 'academic'],
-            'experience': ['experience', 'work', 'employment', 'job', 'internship'],
-            'skills': ['skills', 'technologies', 'tools', 'proficiencies', 'expertise']
-        }
         
         section_scores = {}
-        for section, keywords in essential_sections.items():
-            found = sum(1 for keyword in keywords if keyword in text)
+        for section, keywords in self.essential_sections.items():
+            found = sum(1 for keyword in keywords if self._contains(keyword, text, hits))
             section_scores[section] = min(25, (found / len(keywords)) * 25)
             
         return sum(section_scores.values())
@@ -106,59 +223,34 @@ class ResumeAnalyzer:
             deductions.append("Inconsistent spacing between sections")
             
         # Check for contact information format
-        contact_patterns = [
-            r'\b[\w\.-]+@[\w\.-]+\.\w+\b',  # email
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',  # phone
-            r'linkedin\.com/\w+',  # LinkedIn
-        ]
-        if not any(re.search(pattern, text) for pattern in contact_patterns):
+        if not CONTACT_PATTERN.search(text):
             score -= 15
             deductions.append("Missing or improperly formatted contact information")
             
         return max(0, score), deductions
         
-    def extract_text_from_pdf(self, file):
+    def extract_text_from_pdf(self, file, workers=None):
         try:
-            import PyPDF2
-            import io
-            
-            # Create a PDF reader object
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(file.read()))
-            
-            # Extract text from all pages
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-                
-            return text
+            from utils.document_ingestion import PDF_MEDIA_TYPE, load_document
+            return load_document(file, media_type=PDF_MEDIA_TYPE, workers=workers).text
         except Exception as e:
             raise Exception(f"Error extracting text from PDF: {str(e)}")
             
     def extract_text_from_docx(self, docx_file):
         """Extract text from a DOCX file"""
         try:
-            from docx import Document
-            doc = Document(docx_file)
-            full_text = []
-            for paragraph in doc.paragraphs:
-                full_text.append(paragraph.text)
-            return '\n'.join(full_text)
+            from utils.document_ingestion import DOCX_MEDIA_TYPE, load_document
+            return load_document(docx_file, media_type=DOCX_MEDIA_TYPE).text
         except Exception as e:
             raise Exception(f"Error extracting text from DOCX file: {str(e)}")
 
     def extract_personal_info(self, text):
         """Extract personal information from resume text"""
-        # Basic patterns for personal info
-        email_pattern = r'[\w\.-]+@[\w\.-]+\.\w+'
-        phone_pattern = r'(\+\d{1,3}[-.]?)?\s*\(?\d{3}\)?[-.]?\s*\d{3}[-.]?\s*\d{4}'
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        github_pattern = r'github\.com/[\w-]+'
-        
-        # Extract information
-        email = re.search(email_pattern, text)
-        phone = re.search(phone_pattern, text)
-        linkedin = re.search(linkedin_pattern, text)
-        github = re.search(github_pattern, text)
+        # Extract information (each needs its own first match, so no combined scan)
+        email = EMAIL_PATTERN.search(text)
+        phone = PHONE_PATTERN.search(text)
+        linkedin = LINKEDIN_PATTERN.search(text)
+        github = GITHUB_PATTERN.search(text)
         
         # Get the first line as name (basic assumption)
         name = text.split('\n')[0].strip()
@@ -172,211 +264,93 @@ class ResumeAnalyzer:
             'portfolio': ''  # Can be enhanced later
         }
 
-    def extract_education(self, text):
-        """Extract education information from resume text"""
-        education = []
-        lines = text.split('\n')
-        education_keywords = [
-            'education', 'academic', 'qualification', 'degree', 'university', 'college',
-            'school', 'institute', 'certification', 'diploma', 'bachelor', 'master',
-            'phd', 'b.tech', 'm.tech', 'b.e', 'm.e', 'b.sc', 'm.sc','bca', 'mca', 'b.com',
-            'm.com', 'b.cs-it', 'imca', 'bba', 'mba', 'honors', 'scholarship'
-        ]
-        in_education_section = False
-        current_entry = []
-
-        for line in lines:
+    def segment_sections(self, text):
+        """Split resume text into labelled section entries in a single pass"""
+        if self._segment_cache is not None and self._segment_cache[0] == text:
+            return self._segment_cache[1]
+
+        resume_keywords = {keyword.lower() for keyword in self.document_types['resume']}
+        section_keywords = {
+            section: {keyword.lower() for keyword in keywords}
+            for section, keywords in self.section_keywords.items()
+        }
+        in_section = dict.fromkeys(section_keywords, False)
+        current_entry = {section: [] for section in section_keywords}
+        segments = {section: [] for section in section_keywords}
+
+        for line, hits in zip(text.split('\n'), self._line_hits(text)):
             line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in education_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in education_keywords):
-                    # This line contains education info, not just a header
-                    current_entry.append(line)
-                in_education_section = True
-                continue
-            
-            if in_education_section:
+            line_lower = line.lower()
+            # A line mentioning any resume keyword closes every open section
+            # that does not claim it as its own header
+            ends_section = bool(line) and not hits.isdisjoint(resume_keywords)
+
+            for section, keywords in section_keywords.items():
+                entry = current_entry[section]
+                # Check for section header
+                if not hits.isdisjoint(keywords):
+                    if line_lower not in keywords:
+                        # This line contains section info, not just a header
+                        entry.append(line)
+                    in_section[section] = True
+                    continue
+
+                if not in_section[section]:
+                    continue
+
                 # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(edu_key.lower() in line.lower() for edu_key in education_keywords):
-                        in_education_section = False
-                        if current_entry:
-                            education.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
+                if ends_section:
+                    in_section[section] = False
+                    if entry:
+                        segments[section].append(' '.join(entry))
+                        current_entry[section] = []
+                    continue
+
                 if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    education.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            education.append(' '.join(current_entry))
-        
-        return education
+                    entry.append(line)
+                elif entry:  # Empty line and we have content
+                    segments[section].append(' '.join(entry))
+                    current_entry[section] = []
+
+        for section, entry in current_entry.items():
+            if entry:
+                segments[section].append(' '.join(entry))
+
+        self._segment_cache = (text, segments)
+        return segments
+
+    def extract_education(self, text):
+        """Extract education information from resume text"""
+        return list(self.segment_sections(text)['education'])
 
     def extract_experience(self, text):
         """Extract work experience information from resume text"""
-        experience = []
-        lines = text.split('\n')
-        experience_keywords = [
-            'experience', 'employment', 'work history', 'professional experience',
-            'work experience', 'career history', 'professional background',
-            'employment history', 'job history', 'positions held', 'experience',
-            'job title', 'job responsibilities', 'job description', 'job summary'
-        ]
-        in_experience_section = False
-        current_entry = []
-
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in experience_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in experience_keywords):
-                    # This line contains experience info, not just a header
-                    current_entry.append(line)
-                in_experience_section = True
-                continue
-            
-            if in_experience_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(exp_key.lower() in line.lower() for exp_key in experience_keywords):
-                        in_experience_section = False
-                        if current_entry:
-                            experience.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    experience.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            experience.append(' '.join(current_entry))
-        
-        return experience
+        return list(self.segment_sections(text)['experience'])
 
     def extract_projects(self, text):
         """Extract project information from resume text"""
-        projects = []
-        lines = text.split('\n')
-        project_keywords = [
-            'projects', 'personal projects', 'academic projects', 'key projects',
-            'major projects', 'professional projects', 'project experience',
-            'relevant projects', 'featured projects','latest projects',
-            'top projects'
-        ]
-        in_project_section = False
-        current_entry = []
-
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in project_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in project_keywords):
-                    # This line contains project info, not just a header
-                    current_entry.append(line)
-                in_project_section = True
-                continue
-            
-            if in_project_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(proj_key.lower() in line.lower() for proj_key in project_keywords):
-                        in_project_section = False
-                        if current_entry:
-                            projects.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    projects.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            projects.append(' '.join(current_entry))
-        
-        return projects
+        return list(self.segment_sections(text)['projects'])
 
     def extract_skills(self, text):
         """Extract skills from resume text"""
         skills = set()  # Use set to avoid duplicates
-        lines = text.split('\n')
-        skills_keywords = [
-            'skills', 'technical skills', 'competencies', 'expertise',
-            'core competencies', 'professional skills', 'key skills',
-            'technical expertise', 'proficiencies', 'qualifications',
-            'top skills', 'key skill', 'major skill', 'personal skill',
-            'soft skills', 'soft skill', 'soft skillset'
-        ]
-        in_skills_section = False
-        current_entry = []
 
         # Common skill separators
         separators = [',', '•', '|', '/', '\\', '·', '>', '-', '–', '―']
 
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in skills_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in skills_keywords):
-                    # This line contains skills, not just a header
-                    current_entry.append(line)
-                in_skills_section = True
-                continue
-            
-            if in_skills_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(skill_key.lower() in line.lower() for skill_key in skills_keywords):
-                        in_skills_section = False
-                        if current_entry:
-                            # Process the current entry
-                            text_to_process = ' '.join(current_entry)
-                            # Split by common separators
-                            for separator in separators:
-                                if separator in text_to_process:
-                                    skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    # Process the current entry
-                    text_to_process = ' '.join(current_entry)
-                    # Split by common separators
-                    for separator in separators:
-                        if separator in text_to_process:
-                            skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-                    current_entry = []
-        
-        if current_entry:
-            # Process any remaining skills
-            text_to_process = ' '.join(current_entry)
+        for text_to_process in self.segment_sections(text)['skills']:
+            # Split by common separators
             for separator in separators:
                 if separator in text_to_process:
                     skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-        
+
         return list(skills)
 
     def extract_summary(self, text):
         """Extract summary/objective from resume text"""
         summary = []
         lines = text.split('\n')
-        summary_keywords = [
-            'summary', 'professional summary', 'career summary', 'objective',
-            'career objective', 'professional objective', 'about me', 'profile',
-            'professional profile', 'career profile', 'overview', 'skill summary'
-        ]
-        in_summary_section = False
-        current_entry = []
+        summary_keywords = self.section_keywords['summary']
 
         # Try to find summary at the beginning of the resume
         start_index = 0
@@ -397,63 +371,23 @@ class ResumeAnalyzer:
         if first_lines and not any(keyword in first_lines[0].lower() for keyword in summary_keywords):
             potential_summary = ' '.join(first_lines)
             if len(potential_summary.split()) > 10:  # More than 10 words
-                if not re.search(r'\b(?:email|phone|address|tel|mobile|linkedin)\b', potential_summary.lower()):
+                if not CONTACT_WORDS_PATTERN.search(potential_summary.lower()):
                     summary.append(potential_summary)
 
-        # Look for explicitly marked summary section
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in summary_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in summary_keywords):
-                    # This line contains summary info, not just a header
-                    current_entry.append(line)
-                in_summary_section = True
-                continue
-            
-            if in_summary_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(sum_key.lower() in line.lower() for sum_key in summary_keywords):
-                        in_summary_section = False
-                        if current_entry:
-                            summary.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    summary.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            summary.append(' '.join(current_entry))
-        
+        # Add the explicitly marked summary section
+        summary.extend(self.segment_sections(text)['summary'])
+
         return ' '.join(summary) if summary else ''
 
-    def analyze_resume(self, resume_data, job_requirements):
-        """Analyze resume and return scores and recommendations"""
-        text = resume_data.get('raw_text', '')
-        
+    def _analyze_document(self, text):
+        """Run the role-independent part of the analysis once per document"""
         # Extract personal information
         personal_info = self.extract_personal_info(text)
         
         # First detect document type
         doc_type = self.detect_document_type(text)
         if doc_type != 'resume':
-            return {
-                'ats_score': 0,
-                'document_type': doc_type,
-                'keyword_match': {'score': 0, 'found_skills': [], 'missing_skills': []},
-                'section_score': 0,
-                'format_score': 0,
-                'suggestions': [f"This appears to be a {doc_type} document. Please upload a resume for ATS analysis."]
-            }
-            
-        # Calculate keyword match
-        required_skills = job_requirements.get('required_skills', [])
-        keyword_match = self.calculate_keyword_match(text, required_skills)
+            return {'document_type': doc_type}
         
         # Extract all resume sections
         education = self.extract_education(text)
@@ -485,51 +419,75 @@ class ResumeAnalyzer:
         elif len(summary.split()) > 100:
             summary_suggestions.append("Consider making your summary more concise (aim for 50-75 words)")
         
-        skills_suggestions = []
-        if not skills:
-            skills_suggestions.append("Add a dedicated skills section")
-        if isinstance(skills, (list, set)) and len(list(skills)) < 5:
-            skills_suggestions.append("List more relevant technical and soft skills")
-        if keyword_match['score'] < 70:
-            skills_suggestions.append("Add more skills that match the job requirements")
-        
         experience_suggestions = []
         if not experience:
             experience_suggestions.append("Add your work experience section")
         else:
-            has_dates = any(re.search(r'\b(19|20)\d{2}\b', exp) for exp in experience)
-            has_bullets = any(re.search(r'[•\-\*]', exp) for exp in experience)
-            has_action_verbs = any(re.search(r'\b(developed|managed|created|implemented|designed|led|improved)\b', 
-                                           exp.lower()) for exp in experience)
+            features = _scan_features(EXPERIENCE_FEATURES_PATTERN, experience)
             
-            if not has_dates:
+            if 'date' not in features:
                 experience_suggestions.append("Include dates for each work experience")
-            if not has_bullets:
+            if 'bullet' not in features:
                 experience_suggestions.append("Use bullet points to list your achievements and responsibilities")
-            if not has_action_verbs:
+            if 'action_verb' not in features:
                 experience_suggestions.append("Start bullet points with strong action verbs")
         
         education_suggestions = []
+        has_gpa = False
         if not education:
             education_suggestions.append("Add your educational background")
         else:
-            has_dates = any(re.search(r'\b(19|20)\d{2}\b', edu) for edu in education)
-            has_degree = any(re.search(r'\b(bachelor|master|phd|b\.|m\.|diploma)\b', 
-                                     edu.lower()) for edu in education)
-            has_gpa = any(re.search(r'\b(gpa|cgpa|grade|percentage)\b', 
-                                  edu.lower()) for edu in education)
+            features = _scan_features(EDUCATION_FEATURES_PATTERN, education)
+            has_gpa = 'gpa' in features
             
-            if not has_dates:
+            if 'date' not in features:
                 education_suggestions.append("Include graduation dates")
-            if not has_degree:
+            if 'degree' not in features:
                 education_suggestions.append("Specify your degree type")
-            if not has_gpa and job_requirements.get('require_gpa', False):
-                education_suggestions.append("Include your GPA if it's above 3.0")
         
         format_suggestions = []
         if format_score < 100:
             format_suggestions.extend(format_deductions)
         
+        return {
+            'document_type': 'resume',
+            'personal_info': personal_info,
+            'education': education,
+            'experience': experience,
+            'projects': projects,
+            'skills': skills,
+            'summary': summary,
+            'section_score': section_score,
+            'format_score': format_score,
+            'has_gpa': has_gpa,
+            'contact_suggestions': contact_suggestions,
+            'summary_suggestions': summary_suggestions,
+            'experience_suggestions': experience_suggestions,
+            'education_suggestions': education_suggestions,
+            'format_suggestions': format_suggestions
+        }
+
+    def _score_document(self, document, keyword_match, job_requirements):
+        """Combine a document analysis with one role's keyword match into the final result"""
+        skills = document['skills']
+        format_score = document['format_score']
+        contact_suggestions = list(document['contact_suggestions'])
+        summary_suggestions = list(document['summary_suggestions'])
+        experience_suggestions = list(document['experience_suggestions'])
+        education_suggestions = list(document['education_suggestions'])
+        format_suggestions = list(document['format_suggestions'])
+        
+        skills_suggestions = []
+        if not skills:
+            skills_suggestions.append("Add a dedicated skills section")
+        if isinstance(skills, (list, set)) and len(list(skills)) < 5:
+            skills_suggestions.append("List more relevant technical and soft skills")
+        if keyword_match['score'] < 70:
+            skills_suggestions.append("Add more skills that match the job requirements")
+        
+        if document['education'] and not document['has_gpa'] and job_requirements.get('require_gpa', False):
+            education_suggestions.append("Include your GPA if it's above 3.0")
+        
         # Calculate section-specific scores
         contact_score = 100 - (len(contact_suggestions) * 25)  # -25 for each missing item
         summary_score = 100 - (len(summary_suggestions) * 33)  # -33 for each issue
@@ -537,14 +495,19 @@ class ResumeAnalyzer:
         experience_score = 100 - (len(experience_suggestions) * 25)
         education_score = 100 - (len(education_suggestions) * 25)
         
+        section_scores = {
+            'contact': contact_score,
+            'summary': summary_score,
+            'skills': skills_score,
+            'experience': experience_score,
+            'education': education_score,
+            'format': format_score
+        }
+        
         # Calculate overall ATS score with weighted components
-        ats_score = (
-            int(round(contact_score * 0.1)) +      # 10% weight for contact info
-            int(round(summary_score * 0.1)) +      # 10% weight for summary
-            int(round(skills_score * 0.3)) +       # 30% weight for skills match
-            int(round(experience_score * 0.2)) +   # 20% weight for experience
-            int(round(education_score * 0.1)) +    # 10% weight for education
-            int(round(format_score * 0.2))         # 20% weight for formatting
+        ats_score = sum(
+            int(round(section_scores[section] * weight))
+            for section, weight in SCORING_WEIGHTS.items()
         )
         
         # Combine all suggestions into a single list
@@ -560,17 +523,17 @@ class ResumeAnalyzer:
             suggestions.append("Your resume is well-optimized for ATS systems")
         
         return {
-            **personal_info,  # Include extracted personal info
+            **document['personal_info'],  # Include extracted personal info
             'ats_score': ats_score,
             'document_type': 'resume',
             'keyword_match': keyword_match,
-            'section_score': section_score,
+            'section_score': document['section_score'],
             'format_score': format_score,
-            'education': education,
-            'experience': experience,
-            'projects': projects,
+            'education': document['education'],
+            'experience': document['experience'],
+            'projects': document['projects'],
             'skills': skills,
-            'summary': summary,
+            'summary': document['summary'],
             'suggestions': suggestions,
             'contact_suggestions': contact_suggestions,
             'summary_suggestions': summary_suggestions,
@@ -578,12 +541,105 @@ class ResumeAnalyzer:
             'experience_suggestions': experience_suggestions,
             'education_suggestions': education_suggestions,
             'format_suggestions': format_suggestions,
-            'section_scores': {
-                'contact': contact_score,
-                'summary': summary_score,
-                'skills': skills_score,
-                'experience': experience_score,
-                'education': education_score,
-                'format': format_score
-            }
+            'section_scores': section_scores
         }
+
+    def analyze_resume(self, resume_data, job_requirements):
+        """Analyze resume and return scores and recommendations"""
+        text = resume_data.get('raw_text', '')
+        
+        document = self._analyze_document(text)
+        doc_type = document['document_type']
+        if doc_type != 'resume':
+            return {
+                'ats_score': 0,
+                'document_type': doc_type,
+                'keyword_match': {'score': 0, 'found_skills': [], 'missing_skills': []},
+                'section_score': 0,
+                'format_score': 0,
+                'suggestions': [f"This appears to be a {doc_type} document. Please upload a resume for ATS analysis."]
+            }
+            
+        # Calculate keyword match
+        required_skills = job_requirements.get('required_skills', [])
+        keyword_match = self.calculate_keyword_match(text, required_skills)
+        
+        return self._score_document(document, keyword_match, job_requirements)
+
+    def rank_roles(self, text, top_n=None):
+        """Score the resume against every role in JOB_ROLES, best fit first
+
+        The document is parsed once and the keyword match for all roles comes
+        from a single product of the role x skill matrix with the hit vector.
+        Returns an empty list when the text is not a resume.
+        """
+        document = self._analyze_document(text)
+        if document['document_type'] != 'resume':
+            return []
+        
+        roles, skills, matrix, required_counts = _role_skill_matrix()
+        hits = self._keyword_hits(text)
+        hit_vector = np.fromiter((skill in hits for skill in skills), dtype=np.float64, count=len(skills))
+        found_counts = matrix @ hit_vector
+        keyword_scores = np.divide(found_counts, required_counts,
+                                   out=np.zeros_like(found_counts), where=required_counts > 0) * 100
+        
+        rankings = []
+        for (category, role, role_info), keyword_score in zip(roles, keyword_scores):
+            found_skills = []
+            missing_skills = []
+            for skill in role_info.get('required_skills', []):
+                (found_skills if skill.lower() in hits else missing_skills).append(skill)
+            keyword_match = {
+                'score': float(keyword_score),
+                'found_skills': found_skills,
+                'missing_skills': missing_skills
+            }
+            result = self._score_document(document, keyword_match, role_info)
+            rankings.append({
+                'category': category,
+                'role': role,
+                'ats_score': result['ats_score'],
+                'keyword_match': keyword_match,
+                'section_scores': result['section_scores']
+            })
+        
+        rankings.sort(key=lambda x: (x['ats_score'], x['keyword_match']['score']), reverse=True)
+        return rankings[:top_n] if top_n else rankings
+
+
+def _scan_features(pattern, entries):
+    """Return the named groups of pattern that match in any entry, scanning each entry once"""
+    wanted = set(pattern.groupindex)
+    found = set()
+    for entry in entries:
+        for match in pattern.finditer(entry.lower()):
+            found.add(match.lastgroup)
+            if found == wanted:
+                return found
+    return found
+
+
+@lru_cache(maxsize=1)
+def _role_skill_matrix():
+    """Build the role x required-skill matrix for JOB_ROLES once per process"""
+    roles = []
+    skills = []
+    skill_index = {}
+    entries = []
+    for category, category_roles in JOB_ROLES.items():
+        for role, role_info in category_roles.items():
+            row = len(roles)
+            roles.append((category, role, role_info))
+            for skill in role_info.get('required_skills', []):
+                skill = skill.lower()
+                if skill not in skill_index:
+                    skill_index[skill] = len(skills)
+                    skills.append(skill)
+                entries.append((row, skill_index[skill]))
+    
+    matrix = np.zeros((len(roles), len(skills)), dtype=np.float64)
+    for row, column in entries:
+        matrix[row, column] += 1
+    required_counts = matrix.sum(axis=1)
+    return roles, skills, matrix, required_counts
@@ -1,7 +1,12 @@
-import PyPDF2
-import docx
 import re
-from io import BytesIO
+from utils.document_ingestion import DOCX_MEDIA_TYPE, PDF_MEDIA_TYPE, load_document
+
+# Heading words that open a section; parse keeps the experience and education ones
+SECTION_HEADINGS = {
+    'experience': ('experience', 'employment', 'work history'),
+    'education': ('education', 'academic', 'qualifications'),
+    'other': ('skills', 'projects', 'summary', 'objective', 'certifications', 'achievements', 'languages', 'interests')
+}
 
 class ResumeParser:
     def __init__(self):
@@ -9,44 +14,63 @@ class ResumeParser:
         
     def extract_text_from_pdf(self, pdf_file):
         try:
-            pdf_reader = PyPDF2.PdfReader(BytesIO(pdf_file.read()))
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
+            return load_document(pdf_file, media_type=PDF_MEDIA_TYPE).text.strip()
         except Exception as e:
             print(f"Error extracting text from PDF: {e}")
             return ""
             
     def extract_text_from_docx(self, docx_file):
         try:
-            doc = docx.Document(BytesIO(docx_file.read()))
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
+            return load_document(docx_file, media_type=DOCX_MEDIA_TYPE).text.strip()
         except Exception as e:
             print(f"Error extracting text from DOCX: {e}")
             return ""
             
     def extract_text(self, file):
-        file_content = file.read()
-        file.seek(0)  # Reset file pointer
+        document = self.load(file)
+        return document.text.strip() if document else ""
         
-        if file.name.endswith('.pdf'):
-            return self.extract_text_from_pdf(file)
-        elif file.name.endswith('.docx'):
-            return self.extract_text_from_docx(file)
-        else:
-            return ""
+    def load(self, file):
+        try:
+            return load_document(file)
+        except Exception as e:
+            print(f"Error extracting text: {e}")
+            return None
             
+    def _section_heading(self, paragraph):
+        """Section a short heading paragraph opens, or None for body text"""
+        if len(paragraph.split()) > 4:
+            return None
+        paragraph = paragraph.lower().strip(' :')
+        for section, headings in SECTION_HEADINGS.items():
+            if any(heading in paragraph for heading in headings):
+                return section
+        return None
+        
+    def segment_sections(self, document):
+        """Group the document's paragraphs under the experience/education heading before them"""
+        sections = {'experience': [], 'education': []}
+        current = None
+        for paragraph in document.iter_paragraphs():
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+            heading = self._section_heading(paragraph)
+            if heading:
+                current = heading
+            elif current in sections:
+                sections[current].append(paragraph)
+        return sections
+        
     def parse(self, file):
-        text = self.extract_text(file)
+        document = self.load(file)
+        text = document.text.strip() if document else ""
         
         # Simple keyword-based parsing
         skills = []
-        experience = []
-        education = []
+        sections = self.segment_sections(document) if document else {'experience': [], 'education': []}
+        experience = sections['experience']
+        education = sections['education']
         
         # Common programming languages and tools
         skill_keywords = ['python', 'java', 'javascript', 'html', 'css', 'sql', 'react', 'angular', 'vue', 
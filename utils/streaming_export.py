@@ -0,0 +1,127 @@
+"""
+Constant-memory exports of query results to CSV, JSON, NDJSON and Excel
+
+Rows are paged out of SQLite with fetchmany and written one at a time to a
+temporary file, which is returned rewound as a binary file handle (it can
+be passed straight to st.download_button and is deleted once closed).
+"""
+import csv
+import io
+import json
+import tempfile
+
+from config.database import get_database_connection
+
+# Rows fetched from the cursor per round trip
+CHUNK_SIZE = 1000
+
+# Widest Excel column, in characters
+MAX_EXCEL_COLUMN_WIDTH = 50
+
+RESUME_EXPORT_QUERY = """
+    SELECT
+        rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
+        rd.summary, rd.target_role, rd.target_category,
+        rd.education, rd.experience, rd.projects, rd.skills,
+        ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
+        ra.missing_skills, ra.recommendations,
+        rd.created_at
+    FROM resume_data rd
+    LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
+"""
+
+# Every resume and analysis column; the analysis id/timestamp are renamed so keys stay unique
+RESUME_JSON_EXPORT_QUERY = """
+    SELECT
+        rd.*,
+        ra.id AS analysis_id, ra.resume_id, ra.ats_score, ra.keyword_match_score,
+        ra.format_score, ra.section_score, ra.missing_skills, ra.recommendations,
+        ra.created_at AS analyzed_at
+    FROM resume_data rd
+    LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
+"""
+
+
+def stream_query(query, params=(), chunk_size=CHUNK_SIZE):
+    """Yield the column names, then every row, fetching chunk_size rows at a time"""
+    with get_database_connection() as conn:
+        cursor = conn.execute(query, params)
+        yield [column[0] for column in cursor.description]
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield from rows
+
+
+def rewind_tempfile(handle):
+    """Turn a finished temporary file into a read-only handle positioned at the start"""
+    handle.flush()
+    raw = handle.detach()
+    if not isinstance(raw, io.RawIOBase):
+        # TextIOWrapper detaches to the buffered file, which detaches to the raw one
+        raw = raw.detach()
+    raw.seek(0)
+    return io.BufferedReader(raw)
+
+
+def export_csv(query, params=(), chunk_size=CHUNK_SIZE):
+    """Write query results as UTF-8 CSV with a header row"""
+    text = io.TextIOWrapper(tempfile.TemporaryFile(), encoding='utf-8', newline='')
+    writer = csv.writer(text)
+    rows = stream_query(query, params, chunk_size)
+    writer.writerow(next(rows))
+    writer.writerows(rows)
+    return rewind_tempfile(text)
+
+
+def export_ndjson(query, params=(), chunk_size=CHUNK_SIZE):
+    """Write query results as one JSON object per line"""
+    text = io.TextIOWrapper(tempfile.TemporaryFile(), encoding='utf-8')
+    rows = stream_query(query, params, chunk_size)
+    columns = next(rows)
+    for row in rows:
+        text.write(json.dumps(dict(zip(columns, row)), default=str) + '\n')
+    return rewind_tempfile(text)
+
+
+def export_json(query, params=(), chunk_size=CHUNK_SIZE):
+    """Write query results as a JSON array of records, one record at a time"""
+    text = io.TextIOWrapper(tempfile.TemporaryFile(), encoding='utf-8')
+    rows = stream_query(query, params, chunk_size)
+    columns = next(rows)
+    text.write('[')
+    for index, row in enumerate(rows):
+        text.write((',' if index else '') + json.dumps(dict(zip(columns, row)), default=str))
+    text.write(']')
+    return rewind_tempfile(text)
+
+
+def export_excel(query, params=(), sheet_name='Resume Data', header_format=None, chunk_size=CHUNK_SIZE):
+    """Write query results to an .xlsx sheet with xlsxwriter's constant_memory mode
+
+    Each row is flushed to disk as soon as it is written, and column widths
+    are sized from the longest value seen while streaming. header_format is
+    an optional xlsxwriter format dict for the header row.
+    """
+    import xlsxwriter
+
+    handle = tempfile.TemporaryFile()
+    workbook = xlsxwriter.Workbook(handle, {'constant_memory': True})
+    worksheet = workbook.add_worksheet(sheet_name)
+    header = workbook.add_format(header_format) if header_format else None
+
+    rows = stream_query(query, params, chunk_size)
+    columns = next(rows)
+    worksheet.write_row(0, 0, columns, header)
+    widths = [len(str(column)) for column in columns]
+    for row_number, row in enumerate(rows, start=1):
+        worksheet.write_row(row_number, 0, row)
+        for i, value in enumerate(row):
+            if value is not None and len(str(value)) > widths[i]:
+                widths[i] = len(str(value))
+    for i, width in enumerate(widths):
+        worksheet.set_column(i, i, min(width + 2, MAX_EXCEL_COLUMN_WIDTH))
+
+    workbook.close()
+    return rewind_tempfile(handle)